@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import importlib.util
+import os
 from pathlib import Path
 
 
@@ -39,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'interview.core',
     'interview.inventory',
@@ -46,6 +49,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'interview.core.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -91,6 +95,62 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Serialized responses of the lookup endpoints (types, languages, tags) and
+    # the model versions that also expire each process's name caches.
+    # Use a shared backend such as FileBasedCache or RedisCache when running
+    # more than one process, so signal invalidation reaches every worker.
+    'lookups': {
+        'BACKEND': os.environ.get('LOOKUP_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('LOOKUP_CACHE_LOCATION', 'lookups'),
+        'TIMEOUT': int(os.environ.get('LOOKUP_CACHE_TIMEOUT', 3600)),
+    },
+}
+
+# Upper bound on cached instances per model for UniqueNameModel.get_by_name.
+NAME_CACHE_MAXSIZE = int(os.environ.get('NAME_CACHE_MAXSIZE', 1024))
+
+# Seconds a process keeps using a model's name cache before checking the
+# shared version in the 'lookups' cache again, so writes made by other
+# processes show up within this delay.
+NAME_CACHE_VERSION_TTL = float(os.environ.get('NAME_CACHE_VERSION_TTL', 1))
+
+
+# REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'interview.core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'interview.core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# JSON library behind FastJSONRenderer and the parsers: 'json' (stdlib) or
+# 'orjson', which is optional and used by default when it is installed.
+JSON_BACKEND = os.environ.get('JSON_BACKEND', 'orjson' if importlib.util.find_spec('orjson') else 'json')
+
+
+# Profiling
+# Share of requests (0 to 1) whose query count, SQL, serializer and render
+# time and response size are sampled into the histograms served at /metrics.
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))
+
+# Sends the timings of sampled requests back in a Server-Timing header.
+PROFILING_SERVER_TIMING = os.environ.get('PROFILING_SERVER_TIMING', '').lower() in ('1', 'true', 'yes')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,43 @@
+import os
+
+from .base import *
+
+
+def env_bool(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes')
+
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+DEBUG = False
+
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host]
+
+
+# Database
+# https://docs.djangoproject.com/en/4.1/ref/databases/#persistent-connections
+#
+# Connections are kept open for DB_CONN_MAX_AGE seconds and checked before
+# reuse, so requests skip the TCP and auth handshake. To run behind a
+# transaction-mode pooler such as pgbouncer, point DB_HOST/DB_PORT at the
+# pooler and set DB_POOLER=transaction: server-side cursors cannot outlive a
+# transaction there and are disabled.
+
+DB_POOLER = os.environ.get('DB_POOLER', '')
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('DB_NAME', 'tmt_interview'),
+        'USER': os.environ.get('DB_USER', 'docker'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', '127.0.0.1'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': env_bool('DB_CONN_HEALTH_CHECKS', True),
+        'DISABLE_SERVER_SIDE_CURSORS': DB_POOLER == 'transaction',
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+        },
+    }
+}
@@ -16,8 +16,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from interview.core.views import MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('inventory/', include('interview.inventory.urls')),
-    path('orders/', include('interview.order.urls'))
+    path('orders/', include('interview.order.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview.core'
+
+    def ready(self):
+        from interview.core import signals  # noqa: F401
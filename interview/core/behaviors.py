@@ -1,5 +1,22 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import models, transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from interview.core.cache import get_model_version
+
+# Sent around the single UPDATE of `IsActiveModel.set_active`, which skips
+# the save and delete signals. `pre_set_active` receives the queryset about
+# to change and `is_active`, inside the same transaction as the UPDATE;
+# `post_set_active` receives `is_active` and the number of rows changed.
+pre_set_active = Signal()
+post_set_active = Signal()
 
 
 class UUIDModel(models.Model):
@@ -11,7 +28,7 @@ class UUIDModel(models.Model):
     @classmethod
     def get_by_id(cls, uuid: str):
         try:
-            return cls.objects.get(uuid=uuid)
+            return cls._default_manager.get(uuid=uuid)
         except ObjectDoesNotExist:
             return None
 
@@ -24,19 +41,91 @@ class TimestampedModel(models.Model):
         abstract = True
 
 
+def touch_m2m_owners(sender, instance, action: str, reverse: bool, model, pk_set, **kwargs):
+    """
+    `m2m_changed` receiver for a many-to-many field on a `TimestampedModel`,
+    from either side of the relation: moves `updated_at` forward on the rows
+    whose set changed, which saving them would not do.
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    if not reverse:
+        owners = type(instance)._default_manager.filter(pk=instance.pk)
+    elif pk_set is not None:
+        owners = model._default_manager.filter(pk__in=pk_set)
+    else:
+        field = next(field for field in model._meta.many_to_many if field.remote_field.through is sender)
+        owners = model._default_manager.filter(**{field.name: instance})
+
+    owners.update(updated_at=timezone.now())
+
+
+class ActiveManager(models.Manager):
+    """
+    Manager that only returns rows with `is_active` set.
+    """
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
 class IsActiveModel(models.Model):
+    """
+    `objects` returns active rows only and `all_objects` every row. The
+    default manager is `all_objects`, so related managers, uniqueness checks
+    and the admin still see inactive rows; subclasses that declare their own
+    `Meta` should extend `IsActiveModel.Meta` and declare any partial
+    indexes `WHERE is_active` that their active-only queries need.
+    """
     is_active = models.BooleanField(default=True)
     
+    all_objects = models.Manager()
+    objects = ActiveManager()
+    
     class Meta:
         abstract = True
+        default_manager_name = 'all_objects'
+    
+    @classmethod
+    def activate(cls, pk: int) -> int:
+        return cls.set_active(True, pks=[pk])
+    
+    @classmethod
+    def deactivate(cls, pk: int) -> int:
+        return cls.set_active(False, pks=[pk])
     
     @classmethod
-    def activate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=False)
+    def activate_many(cls, pks=None, queryset=None) -> int:
+        return cls.set_active(True, pks=pks, queryset=queryset)
     
     @classmethod
-    def deactivate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=True)
+    def deactivate_many(cls, pks=None, queryset=None) -> int:
+        return cls.set_active(False, pks=pks, queryset=queryset)
+    
+    @classmethod
+    def set_active(cls, is_active: bool, pks=None, queryset=None) -> int:
+        """
+        Sets `is_active` on the rows of `queryset` (every row by default),
+        narrowed to `pks` when given, with one UPDATE. Rows already in that
+        state are left alone, so the count returned is the number changed.
+        """
+        if queryset is None:
+            queryset = cls._default_manager.all()
+        if pks is not None:
+            queryset = queryset.filter(pk__in=pks)
+        queryset = queryset.exclude(is_active=is_active)
+        
+        values = {'is_active': is_active}
+        if any(field.name == 'updated_at' for field in cls._meta.concrete_fields):
+            values['updated_at'] = timezone.now()
+        
+        with transaction.atomic(using=queryset.db):
+            pre_set_active.send(sender=cls, queryset=queryset, is_active=is_active)
+            count = queryset.update(**values)
+            post_set_active.send(sender=cls, is_active=is_active, count=count)
+        
+        return count
         
 
 class NameModel(models.Model):
@@ -47,7 +136,98 @@ class NameModel(models.Model):
     
     @classmethod
     def get_by_name(cls, name: str):
-        return cls.objects.filter(name=name)
+        return cls._default_manager.filter(name=name)
+
+
+class NameCache:
+    """
+    Size-bounded, least-recently-used map of name to instance for a single
+    `UniqueNameModel` subclass. Instances are copied on the way in and out so
+    callers never share state with the cache.
+    
+    Entries belong to a `version` of the model, the stamp shared through the
+    lookups cache: `refresh` drops them once another process has moved it
+    forward, and `set` ignores instances read under an older one. The
+    shared version is read at most once per `ttl` seconds, so hits stay in
+    process even when the lookups cache is a file or network backend.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.version = None
+        self.checked_at = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def get(self, name: str):
+        with self.lock:
+            instance = self.entries.get(name)
+            if instance is None:
+                self.misses += 1
+                return None
+            
+            self.entries.move_to_end(name)
+            self.hits += 1
+        
+        return copy.copy(instance)
+    
+    def refresh(self, model, ttl: float):
+        """
+        Returns the shared version of `model`, reading it again once `ttl`
+        seconds have passed since the last read.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if self.checked_at is not None and now - self.checked_at < ttl:
+                return self.version
+        
+        version = get_model_version(model)
+        with self.lock:
+            if version != self.version:
+                self.entries.clear()
+                self.version = version
+            self.checked_at = now
+        
+        return version
+    
+    def expire(self):
+        """
+        Makes the next `refresh` read the shared version, such as after this
+        process has moved it forward.
+        """
+        with self.lock:
+            self.checked_at = None
+    
+    def set(self, instance, version=None):
+        with self.lock:
+            if version is not None and version != self.version:
+                return
+            
+            self.entries[instance.name] = copy.copy(instance)
+            self.entries.move_to_end(instance.name)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+    
+    def info(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+        }
+
+
+_name_caches = {}
+
+
+def get_name_cache(model) -> NameCache:
+    return _name_caches.setdefault(model, NameCache(getattr(settings, 'NAME_CACHE_MAXSIZE', 1024)))
 
 
 class UniqueNameModel(models.Model):
@@ -58,7 +238,41 @@ class UniqueNameModel(models.Model):
         
     @classmethod
     def get_by_name(cls, name: str):
+        cache = get_name_cache(cls)
+        version = cache.refresh(cls, getattr(settings, 'NAME_CACHE_VERSION_TTL', 1))
+        instance = cache.get(name)
+        if instance is not None:
+            return instance
+        
         try:
-            return cls.objects.get(name=name)
+            instance = cls._default_manager.get(name=name)
         except ObjectDoesNotExist:
-            return None
\ No newline at end of file
+            return None
+        
+        cache.set(instance, version)
+        
+        return instance
+    
+    @classmethod
+    def get_many_by_name(cls, names) -> dict:
+        cache = get_name_cache(cls)
+        version = cache.refresh(cls, getattr(settings, 'NAME_CACHE_VERSION_TTL', 1))
+        found = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            instance = cache.get(name)
+            if instance is None:
+                missing.append(name)
+            else:
+                found[name] = instance
+        
+        if missing:
+            for instance in cls._default_manager.filter(name__in=missing):
+                cache.set(instance, version)
+                found[instance.name] = instance
+        
+        return found
+    
+    @classmethod
+    def name_cache_info(cls) -> dict:
+        return get_name_cache(cls).info()
\ No newline at end of file
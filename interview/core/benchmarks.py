@@ -0,0 +1,84 @@
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.db import connection, transaction
+
+from interview.core.fastpath import FastPathSerializer
+from interview.core.fields import SchemaField
+from interview.core.pagination import KeysetPagination
+from interview.inventory.models import Inventory
+from interview.inventory.schemas import InventoryMetaData
+from interview.inventory.serializers import InventorySerializer
+from interview.order.models import Order
+from interview.order.serializers import OrderSerializer
+
+
+def best_of(repeat: int, function) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+@contextmanager
+def without_indexes():
+    """
+    Turns off index and bitmap scans on the default connection until the
+    block ends, to time the scans an index replaces.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_indexscan = off')
+            cursor.execute('SET LOCAL enable_bitmapscan = off')
+        yield
+
+
+def get_micro_benchmarks(rows: int) -> dict:
+    """
+    Returns `{name: (operations, function)}` for the serializer, metadata
+    validation and queryset construction micro-benchmarks, run over the
+    first `rows` rows of the current database. Each serializer benchmark,
+    DRF or fast path, evaluates a fresh copy of the same queryset, so both
+    include their queries.
+    """
+    ordering = KeysetPagination.ordering
+    inventories = Inventory.objects.with_related().order_by(*ordering)[:rows]
+    orders = Order.all_objects.with_related().order_by(*ordering)[:rows]
+    metadata = [inventory.metadata for inventory in inventories]
+    inventory_fast_path = FastPathSerializer(InventorySerializer)
+    order_fast_path = FastPathSerializer(OrderSerializer)
+    metadata_field = SchemaField(InventoryMetaData)
+    today = date.today()
+
+    def compile_queryset(queryset):
+        return queryset.query.get_compiler(connection=connection).as_sql()
+
+    return {
+        'InventorySerializer': (len(inventories), lambda: InventorySerializer(inventories.all(), many=True).data),
+        'InventorySerializer fast path': (len(inventories), lambda: inventory_fast_path.serialize(inventories.all())),
+        'OrderSerializer': (len(orders), lambda: OrderSerializer(orders.all(), many=True).data),
+        'OrderSerializer fast path': (len(orders), lambda: order_fast_path.serialize(orders.all())),
+        'InventoryMetaData validation': (len(metadata), lambda: metadata_field.validate_many(metadata)),
+        'inventory list queryset': (1, lambda: compile_queryset(
+            Inventory.objects.with_related().filter_metadata(year_min=2000, imdb_rating_min=7, actors=['Keanu Reeves'])
+            .order_by(*ordering)[:KeysetPagination.page_size + 1]
+        )),
+        'order window queryset': (1, lambda: compile_queryset(
+            Order.objects.with_related().in_window(today, today + timedelta(days=30)).with_tags(['Austin'])
+            .order_by(*ordering)[:KeysetPagination.page_size + 1]
+        )),
+    }
+
+
+def get_commit() -> str:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return result.stdout.strip()
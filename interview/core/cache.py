@@ -0,0 +1,97 @@
+import hashlib
+import json
+import time
+from datetime import datetime
+from functools import partial, wraps
+
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import quote_etag
+from django.utils.http import parse_etags
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+LOOKUP_CACHE_ALIAS = 'lookups'
+
+
+def get_lookup_cache():
+    return caches[LOOKUP_CACHE_ALIAS]
+
+
+def get_version_key(model) -> str:
+    return f'lookups:version:{model._meta.label_lower}'
+
+
+def get_model_version(model) -> int:
+    return get_lookup_cache().get_or_set(get_version_key(model), time.time_ns)
+
+
+def bump_model_version(model):
+    get_lookup_cache().set(get_version_key(model), time.time_ns(), timeout=None)
+
+
+def invalidate_model_cache(sender, **kwargs):
+    """
+    Signal receiver that retires every cached response for `sender` by moving
+    its version forward once the current transaction commits, so nothing
+    read before the commit is cached under the new version.
+    """
+    transaction.on_commit(partial(bump_model_version, sender))
+
+
+def get_etag(data) -> str:
+    payload = json.dumps(data, cls=JSONEncoder, sort_keys=True, separators=(',', ':'))
+
+    return quote_etag(hashlib.md5(payload.encode('utf-8')).hexdigest())
+
+
+def get_row_validators(request, rows) -> tuple:
+    """
+    A weak ETag and the latest timestamp for a response built from `rows`,
+    each a primary key followed by the values that change with it: the
+    `updated_at` of the row and of rows nested in it, and the versions of
+    the lookups nested in it. The ETag also covers the request path and
+    `Accept` header, which select the page and its representation.
+    """
+    digest = hashlib.md5(f'{request.get_full_path()}|{request.META.get("HTTP_ACCEPT", "")}'.encode('utf-8'))
+
+    last_modified = None
+    for pk, *values in rows:
+        digest.update(f'|{pk}:{",".join(str(value) for value in values)}'.encode('utf-8'))
+        latest = max((value for value in values if isinstance(value, datetime)), default=None)
+        if latest is not None and (last_modified is None or latest > last_modified):
+            last_modified = latest
+
+    return f'W/"{digest.hexdigest()}"', last_modified
+
+
+def cached_response(method):
+    """
+    Caches the serialized data of a successful `get` on a view whose
+    `queryset` model invalidates it through `invalidate_model_cache`, and
+    answers matching `If-None-Match` requests with a 304.
+    """
+    @wraps(method)
+    def wrapper(self, request: Request, *args, **kwargs) -> Response:
+        cache = get_lookup_cache()
+        model = self.queryset.model
+        key = f'lookups:{model._meta.label_lower}:{get_model_version(model)}:{request.get_full_path()}'
+
+        entry = cache.get(key)
+        if entry is None:
+            response = method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+            entry = (get_etag(response.data), response.data)
+            cache.set(key, entry)
+
+        etag, data = entry
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if '*' in if_none_match or etag in if_none_match:
+            return Response(status=304, headers={'ETag': etag})
+
+        return Response(data, status=200, headers={'ETag': etag})
+
+    return wrapper
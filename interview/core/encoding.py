@@ -0,0 +1,87 @@
+import json
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.json import strict_constant
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = ('json', 'orjson')
+
+# Dates and times are handed back to DRF's encoder, which trims them to
+# milliseconds and writes UTC as 'Z'; orjson's own format differs.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+# orjson writes exponents without the stdlib's sign and padding (`1e16`,
+# `1e-5` rather than `1e+16`, `1e-05`). A match inside a string only costs
+# a stdlib re-encode.
+ORJSON_EXPONENT = re.compile(rb'[0-9]e-?[0-9]')
+
+_encoder = JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+
+
+def get_json_backend() -> str:
+    backend = settings.JSON_BACKEND
+    if backend not in JSON_BACKENDS:
+        raise ImproperlyConfigured(f'JSON_BACKEND must be one of {", ".join(JSON_BACKENDS)}, not {backend!r}')
+    if backend == 'orjson' and orjson is None:
+        raise ImproperlyConfigured('JSON_BACKEND is set to orjson, but orjson is not installed')
+
+    return backend
+
+
+def dumps(data) -> bytes:
+    """
+    Encodes `data` as compact UTF-8 JSON, byte for byte what DRF's
+    `JSONRenderer` produces with the default settings.
+
+    With the orjson backend, values orjson cannot encode itself (Decimal,
+    dates and times, querysets...) go through DRF's `JSONEncoder.default`.
+    The stdlib encodes instead whenever orjson's output could differ:
+    anything orjson rejects, such as integers wider than 64 bits, floats it
+    writes in exponent form, and NaN or infinity, which orjson writes as
+    `null`. Those are caught by decoding output that contains `null` and
+    comparing it with `data`, which stays much cheaper than the stdlib
+    encoder; the stdlib then raises `ValueError` as `JSONRenderer` does.
+    """
+    content = None
+    if get_json_backend() == 'orjson':
+        try:
+            content = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+
+        if content is not None and (
+            ORJSON_EXPONENT.search(content) or (b'null' in content and orjson.loads(content) != data)
+        ):
+            content = None
+
+    if content is None:
+        content = _encoder.encode(data).encode('utf-8')
+
+    # Keep the output a strict JavaScript subset, as JSONRenderer does.
+    if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+        content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+    return content
+
+
+def loads(content: bytes | str):
+    """
+    Decodes JSON, rejecting NaN and infinity like DRF's `JSONParser`. Raises
+    `ValueError` on invalid input with either backend. Input orjson rejects
+    but the stdlib reads, such as integers wider than 64 bits, is decoded by
+    the stdlib.
+    """
+    if get_json_backend() == 'orjson':
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(content, parse_constant=strict_constant)
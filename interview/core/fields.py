@@ -0,0 +1,104 @@
+import json
+from decimal import Decimal
+from functools import lru_cache
+
+from pydantic import validate_model
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.json import decimal_encoder, pydantic_encoder
+from rest_framework import serializers
+
+JSON_TYPES = (str, int, float, bool)
+
+
+def encode(value):
+    return json.loads(json.dumps(value, default=pydantic_encoder))
+
+
+@lru_cache(maxsize=None)
+def get_encoders(schema) -> tuple:
+    """
+    Pairs the fields of `schema` whose validated values are not JSON
+    primitives with the conversion `schema.json()` would apply to them.
+    Worked out once per schema, since DRF copies serializer fields for every
+    serializer instance.
+    """
+    encoders = []
+    for name, field in schema.__fields__.items():
+        if field.shape in (SHAPE_SINGLETON, SHAPE_LIST) and field.type_ in JSON_TYPES and not field.sub_fields:
+            continue
+        if field.shape == SHAPE_SINGLETON and field.type_ is Decimal:
+            encoders.append((name, decimal_encoder))
+        else:
+            encoders.append((name, encode))
+
+    return tuple(encoders)
+
+
+def get_error_detail(errors: list[dict]) -> dict:
+    """
+    Turns pydantic errors into DRF-style field errors, keyed by the dotted
+    location of each invalid value (`actors.0`).
+    """
+    detail = {}
+    for error in errors:
+        detail.setdefault('.'.join(str(loc) for loc in error['loc']), []).append(error['msg'])
+
+    return detail
+
+
+class SchemaField(serializers.Field):
+    """
+    A JSON object validated against a pydantic model.
+
+    Validated data holds the same JSON primitives `schema.json()` would
+    produce, so it can go straight into a `JSONField`, but no model instance
+    is built and the payload is walked once. Invalid payloads report one
+    list of messages per field, as `{'year': [...], 'actors.0': [...]}`.
+    """
+    default_error_messages = {
+        'not_a_dict': 'Expected a dictionary of items but got type "{input_type}".',
+    }
+
+    def __init__(self, schema, **kwargs):
+        self.schema = schema
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data) -> dict:
+        if not isinstance(data, dict):
+            self.fail('not_a_dict', input_type=type(data).__name__)
+
+        validated, errors = self.validate_many([data])
+        if errors:
+            raise serializers.ValidationError(errors[0])
+
+        return validated[0]
+
+    def to_representation(self, value):
+        return value
+
+    def validate_many(self, payloads: list) -> tuple[dict, dict]:
+        """
+        Validates a batch of payloads, returning the validated data and the
+        errors of the invalid ones, each keyed by position in `payloads`.
+        The schema's encoders are looked up once for the whole batch and an
+        invalid payload does not stop the rest.
+        """
+        encoders = get_encoders(self.schema)
+        validated = {}
+        errors = {}
+        for index, data in enumerate(payloads):
+            if not isinstance(data, dict):
+                errors[index] = [self.error_messages['not_a_dict'].format(input_type=type(data).__name__)]
+                continue
+
+            values, _, error = validate_model(self.schema, data)
+            if error is not None:
+                errors[index] = get_error_detail(error.errors())
+                continue
+
+            for name, encoder in encoders:
+                if values.get(name) is not None:
+                    values[name] = encoder(values[name])
+            validated[index] = values
+
+        return validated, errors
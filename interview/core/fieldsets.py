@@ -0,0 +1,161 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def get_nested(field):
+    """
+    The nested serializer behind a relation field, or None for any other
+    field.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+
+    return field if isinstance(field, serializers.Serializer) else None
+
+
+def split(value: str) -> list[str]:
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+class Fieldset:
+    """
+    The part of a serializer a request asks for with `?fields=` and
+    `?expand=`, both comma-separated and dotted into nested serializers:
+    `?fields=id,name` or `?fields=id,inventory.name&expand=tags`.
+
+    `fields` is None when every field is selected. A selected relation is
+    rendered as its primary key (or a list of them) unless it is expanded,
+    in which case `expand` maps its name to the nested `Fieldset`. Naming a
+    field inside a relation expands that relation.
+    """
+    __slots__ = ('fields', 'expand')
+
+    def __init__(self, fields: set = None, expand: dict = None):
+        self.fields = fields
+        self.expand = expand or {}
+
+    @classmethod
+    def from_query(cls, serializer, fields: str = None, expand: str = None):
+        """
+        Parses the query parameters against `serializer`, an instance, and
+        returns None when neither is given, meaning the full representation.
+        """
+        fields = split(fields)
+        expand = split(expand)
+        if not fields and not expand:
+            return None
+
+        fieldset = cls(set() if fields else None)
+        for path in fields:
+            fieldset.select(serializer, path, 'fields')
+        for path in expand:
+            fieldset.select(serializer, path, 'expand')
+
+        return fieldset
+
+    @property
+    def key(self) -> tuple:
+        return (
+            None if self.fields is None else frozenset(self.fields),
+            frozenset((name, fieldset.key) for name, fieldset in self.expand.items()),
+        )
+
+    def includes(self, name: str) -> bool:
+        return self.fields is None or name in self.fields
+
+    def select(self, serializer, path: str, param: str):
+        fieldset = self
+        names = path.split('.')
+        for depth, name in enumerate(names):
+            field = serializer.fields.get(name)
+            if field is None or field.write_only:
+                raise ValidationError({param: [f'Unknown field: {path}']})
+
+            if fieldset.fields is not None:
+                fieldset.fields.add(name)
+            if depth == len(names) - 1 and param == 'fields':
+                return
+
+            serializer = get_nested(field)
+            if serializer is None:
+                raise ValidationError({param: [f'Not a relation: {".".join(names[:depth + 1])}']})
+
+            if name not in fieldset.expand:
+                fieldset.expand[name] = Fieldset(None if param == 'expand' else set())
+            fieldset = fieldset.expand[name]
+
+    def apply(self, serializer):
+        """
+        Trims a serializer instance in place: unselected fields are removed
+        and unexpanded relations become read-only primary key fields.
+        """
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+
+        for name, field in list(serializer.fields.items()):
+            if field.write_only or not self.includes(name):
+                del serializer.fields[name]
+            elif name in self.expand:
+                self.expand[name].apply(field)
+            elif get_nested(field) is not None:
+                serializer.fields[name] = serializers.PrimaryKeyRelatedField(
+                    read_only=True,
+                    many=isinstance(field, serializers.ListSerializer),
+                    **({'source': field.source} if field.source != name else {}),
+                )
+
+        return serializer
+
+    def prune(self, queryset, serializer_class, extra: tuple = ()):
+        """
+        Restricts `queryset` to the columns and relations the trimmed
+        serializer reads, with `.only()`, `select_related()` only for expanded
+        forward relations and a `Prefetch` per selected many relation. `extra`
+        names columns the caller needs besides, such as pagination keys.
+        """
+        only, select, prefetch = get_projection(self.apply(serializer_class()), queryset.model)
+        queryset = queryset.select_related(None).prefetch_related(None).only(*only, *extra)
+        if select:
+            queryset = queryset.select_related(*select)
+
+        return queryset.prefetch_related(*prefetch)
+
+
+def get_projection(serializer, model, prefix: str = '') -> tuple[list, list, list]:
+    """
+    Returns the `.only()` paths, `select_related()` paths and `Prefetch`
+    objects needed to serialize `model` instances with `serializer`.
+    """
+    only = []
+    select = []
+    prefetch = []
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        related_model = model
+        for attr in field.source_attrs:
+            related_model = related_model._meta.get_field(attr).related_model
+        path = prefix + '__'.join(field.source_attrs)
+        nested = get_nested(field)
+
+        if isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            queryset = related_model._default_manager.only('pk')
+            if nested is not None:
+                child_only, child_select, child_prefetch = get_projection(nested, related_model)
+                queryset = related_model._default_manager.only(*child_only).prefetch_related(*child_prefetch)
+                if child_select:
+                    queryset = queryset.select_related(*child_select)
+            prefetch.append(Prefetch(path, queryset=queryset))
+        elif nested is not None:
+            only.append(path)
+            select.append(path)
+            nested_only, nested_select, nested_prefetch = get_projection(nested, related_model, f'{path}__')
+            only.extend(nested_only)
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+        else:
+            only.append(path)
+
+    return only, select, prefetch
@@ -0,0 +1,153 @@
+import asyncio
+import io
+import statistics
+import threading
+import time
+
+from django.db import connections
+
+
+def build_environ(path: str, query_string: str = '', host: str = 'localhost') -> dict:
+    return {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query_string,
+        'SERVER_NAME': host,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': host,
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': io.StringIO(),
+        'wsgi.url_scheme': 'http',
+        'wsgi.version': (1, 0),
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+
+
+def run_wsgi_load(application, path: str, concurrency: int, requests: int, query_string: str = '', host: str = 'localhost') -> dict:
+    """
+    Sends `requests` GETs per thread from `concurrency` threads straight into a
+    WSGI application, so the full request cycle (middleware, connection
+    handling, rendering) runs without a socket in between.
+    """
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def start_response(status, headers, exc_info=None):
+        with lock:
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def worker():
+        try:
+            for _ in range(requests):
+                start = time.perf_counter()
+                body = application(build_environ(path, query_string, host), start_response)
+                try:
+                    b''.join(body)
+                finally:
+                    body.close()
+                elapsed = time.perf_counter() - start
+                with lock:
+                    latencies.append(elapsed)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    return dict(summarize(latencies), duration=duration, throughput=len(latencies) / duration, statuses=statuses)
+
+
+def build_scope(path: str, query_string: str = '', host: str = 'localhost') -> dict:
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string.encode(),
+        'root_path': '',
+        'headers': [(b'host', host.encode()), (b'accept', b'application/json')],
+        'client': ('127.0.0.1', 0),
+        'server': (host, 80),
+    }
+
+
+async def asgi_request(application, scope: dict) -> int:
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    status = None
+
+    async def receive():
+        return messages.pop() if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await application(scope, receive, send)
+
+    return status
+
+
+def run_asgi_load(application, path: str, concurrency: int, requests: int, query_string: str = '', host: str = 'localhost') -> dict:
+    """
+    Runs `concurrency` concurrent clients on one event loop, each sending
+    `requests` GETs straight into an ASGI application.
+    """
+    latencies = []
+    statuses = {}
+
+    async def client():
+        for _ in range(requests):
+            start = time.perf_counter()
+            status = await asgi_request(application, build_scope(path, query_string, host))
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    async def main():
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    duration = time.perf_counter() - start
+    connections.close_all()
+
+    return dict(summarize(latencies), duration=duration, throughput=len(latencies) / duration, statuses=statuses)
+
+
+def summarize(latencies: list[float]) -> dict:
+    """
+    Request count and latency statistics in milliseconds. The statistics are
+    `None` when fewer than two requests completed.
+    """
+    if len(latencies) < 2:
+        return {'requests': len(latencies), 'mean_ms': None, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+
+    quantiles = statistics.quantiles(latencies, n=100)
+
+    return {
+        'requests': len(latencies),
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'p50_ms': quantiles[49] * 1000,
+        'p95_ms': quantiles[94] * 1000,
+        'p99_ms': quantiles[98] * 1000,
+    }
+
+
+def format_percentiles(result: dict) -> str:
+    return ', '.join(
+        f'{name} ' + ('n/a' if result[f'{name}_ms'] is None else f'{result[f"{name}_ms"]:.2f} ms')
+        for name in ('p50', 'p95', 'p99')
+    )
@@ -0,0 +1,40 @@
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+
+from interview.core.loadtest import format_percentiles, run_asgi_load
+
+
+class Command(BaseCommand):
+    help = 'Compares throughput of the sync and async read endpoints served through the ASGI application.'
+
+    endpoints = {
+        'inventory list': ('/inventory/', '/inventory/async/'),
+        'order list': ('/orders/', '/orders/async/'),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=32, help='Number of concurrent clients.')
+        parser.add_argument('--requests', type=int, default=50, help='Requests sent by each client.')
+        parser.add_argument('--query-string', default='page_size=20', help='Query string sent with each request.')
+        parser.add_argument('--host', default='localhost', help='Host header sent with each request.')
+
+    def handle(self, *args, **options):
+        application = get_asgi_application()
+
+        for name, paths in self.endpoints.items():
+            for mode, path in zip(('sync', 'async'), paths):
+                result = run_asgi_load(
+                    application,
+                    path,
+                    options['concurrency'],
+                    options['requests'],
+                    query_string=options['query_string'],
+                    host=options['host'],
+                )
+
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({mode}) {path}'))
+                self.stdout.write(
+                    f'{result["requests"]} requests, {result["throughput"]:.0f} req/s, '
+                    f'{format_percentiles(result)}, '
+                    f'statuses {result["statuses"]}'
+                )
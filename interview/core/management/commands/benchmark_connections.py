@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+
+from interview.core.loadtest import format_percentiles, run_wsgi_load
+
+
+class Command(BaseCommand):
+    help = 'Compares request latency under concurrent load with fresh, persistent and pooled database connections.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/inventory/', help='Endpoint to request.')
+        parser.add_argument('--query-string', default='page_size=10', help='Query string sent with each request.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent client threads.')
+        parser.add_argument('--requests', type=int, default=200, help='Requests sent by each thread.')
+        parser.add_argument('--host', default='localhost', help='Host header sent with each request.')
+        parser.add_argument('--conn-max-age', type=int, default=60, help='CONN_MAX_AGE for the persistent run.')
+        parser.add_argument('--pooler-host', help='Host of a transaction-mode pooler such as pgbouncer.')
+        parser.add_argument('--pooler-port', help='Port of the pooler.')
+
+    def handle(self, *args, **options):
+        scenarios = {
+            'fresh connections': {'CONN_MAX_AGE': 0},
+            'persistent connections': {'CONN_MAX_AGE': options['conn_max_age'], 'CONN_HEALTH_CHECKS': True},
+        }
+        if options['pooler_host']:
+            scenarios['pooled connections'] = {
+                'HOST': options['pooler_host'],
+                'PORT': options['pooler_port'] or '',
+                'CONN_MAX_AGE': options['conn_max_age'],
+                'CONN_HEALTH_CHECKS': True,
+                'DISABLE_SERVER_SIDE_CURSORS': True,
+            }
+
+        application = get_wsgi_application()
+        database = connections.settings['default']
+        original = dict(database)
+        try:
+            for name, overrides in scenarios.items():
+                connections.close_all()
+                database.update(overrides)
+                result = run_wsgi_load(
+                    application,
+                    options['path'],
+                    options['concurrency'],
+                    options['requests'],
+                    query_string=options['query_string'],
+                    host=options['host'],
+                )
+                database.clear()
+                database.update(original)
+
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(
+                    f'{result["requests"]} requests, {result["throughput"]:.0f} req/s, '
+                    f'{format_percentiles(result)}, '
+                    f'statuses {result["statuses"]}'
+                )
+        finally:
+            database.clear()
+            database.update(original)
+            connections.close_all()
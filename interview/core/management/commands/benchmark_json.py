@@ -0,0 +1,74 @@
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from interview.core.benchmarks import best_of
+from interview.core.encoding import JSON_BACKENDS, orjson
+from interview.core.parsers import FastJSONParser
+from interview.core.renderers import FastJSONRenderer
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import InventorySerializer
+from interview.order.models import Order
+from interview.order.serializers import OrderSerializer
+
+# Values the API hands to the renderer outside serializer fields: Decimal and
+# dates inside metadata, UUID primary keys, and characters JSONRenderer escapes.
+SAMPLE = {
+    'decimal': Decimal('7.5'),
+    'decimals': [Decimal('0'), Decimal('-12.25'), Decimal('9.9')],
+    'date': date(2023, 3, 14),
+    'datetime': datetime(2023, 3, 14, 15, 9, 26, 535897, tzinfo=timezone.utc),
+    'naive_datetime': datetime(2023, 3, 14, 15, 9, 26),
+    'offset_datetime': datetime(2023, 3, 14, 15, 9, 26, 535000, tzinfo=timezone(timedelta(hours=-5))),
+    'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'text': 'Am\u00e9lie \u2014 \u2028line\u2029 "quoted" \\ \t',
+    'nested': {1: [True, False, None], 'float': 0.1, 'big': 2 ** 70},
+}
+
+
+class Command(BaseCommand):
+    help = 'Compares FastJSONRenderer and FastJSONParser throughput per JSON backend with JSONRenderer and JSONParser on API payloads.'
+
+    targets = {
+        'inventory': (Inventory, InventorySerializer),
+        'order': (Order, OrderSerializer),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Number of rows in each rendered payload.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs; the best is reported.')
+
+    def handle(self, *args, **options):
+        backends = [backend for backend in JSON_BACKENDS if backend != 'orjson' or orjson is not None]
+        payloads = {'sample': SAMPLE}
+        for name, (model, serializer_class) in self.targets.items():
+            queryset = model._default_manager.with_related().order_by('created_at', 'id')[:options['rows']]
+            payloads[name] = {'next': None, 'results': serializer_class(queryset, many=True).data}
+
+        for name, data in payloads.items():
+            expected = JSONRenderer().render(data)
+            render = best_of(options['repeat'], lambda: JSONRenderer().render(data))
+            parse = best_of(options['repeat'], lambda: JSONParser().parse(io.BytesIO(expected)))
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name}: {len(expected) / 1024:.0f} KiB'))
+            self.stdout.write(f'JSONRenderer render {self.rate(expected, render)}, parse {self.rate(expected, parse)}')
+
+            for backend in backends:
+                with override_settings(JSON_BACKEND=backend):
+                    fast_render = best_of(options['repeat'], lambda: FastJSONRenderer().render(data))
+                    fast_parse = best_of(options['repeat'], lambda: FastJSONParser().parse(io.BytesIO(expected)))
+
+                self.stdout.write(
+                    f'{backend}: render {self.rate(expected, fast_render)} ({render / fast_render:.1f}x), '
+                    f'parse {self.rate(expected, fast_parse)} ({parse / fast_parse:.1f}x)'
+                )
+
+    @staticmethod
+    def rate(content: bytes, seconds: float) -> str:
+        return f'{len(content) / seconds / 1024 ** 2:.0f} MiB/s'
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from interview.core.benchmarks import best_of
+from interview.core.fastpath import FastPathSerializer
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import InventorySerializer
+from interview.order.models import Order
+from interview.order.serializers import OrderSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compares the rows/sec of the fast-path serializers and the DRF serializers they mirror.'
+
+    targets = {
+        'inventory': (Inventory, InventorySerializer),
+        'order': (Order, OrderSerializer),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Number of rows serialized per run.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported.')
+
+    def handle(self, *args, **options):
+        for name, (model, serializer_class) in self.targets.items():
+            fast_path = FastPathSerializer(serializer_class)
+            queryset = model._default_manager.with_related().order_by('created_at', 'id')[:options['rows']]
+            rows = len(queryset)
+            drf = best_of(options['repeat'], lambda: serializer_class(queryset.all(), many=True).data)
+            fast = best_of(options['repeat'], lambda: fast_path.serialize(queryset.all()))
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name}: {rows} rows'))
+            self.stdout.write(
+                f'{serializer_class.__name__} {rows / drf:.0f} rows/s, '
+                f'fast path {rows / fast:.0f} rows/s ({drf / fast:.1f}x)'
+            )
@@ -0,0 +1,132 @@
+import json
+import platform
+from datetime import date, datetime, timezone
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+
+from interview.core.benchmarks import best_of, get_commit, get_micro_benchmarks
+from interview.core.loadtest import format_percentiles, run_asgi_load, run_wsgi_load
+from interview.core.profiling import registry
+from interview.inventory.models import Inventory
+from interview.order.models import Order
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs the serializer, metadata validation and queryset micro-benchmarks, then drives the WSGI and ASGI '
+        'applications with concurrent clients, and optionally stores the results as JSON or compares them with a '
+        'previous run.'
+    )
+
+    paths = [
+        '/inventory/?page_size=20',
+        '/inventory/async/?page_size=20',
+        '/inventory/search/?q=matrix',
+        '/orders/?page_size=20',
+        '/orders/async/?page_size=20',
+        '/orders/window/?date={today}&page_size=20',
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Number of rows per serializer micro-benchmark.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of timed micro-benchmark runs; the best is kept.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent load clients.')
+        parser.add_argument('--requests', type=int, default=50, help='Requests sent by each load client.')
+        parser.add_argument('--servers', nargs='+', choices=['wsgi', 'asgi'], default=['wsgi', 'asgi'], help='Applications to load.')
+        parser.add_argument('--path', action='append', dest='paths', help='Endpoint to load, with its query string; repeatable.')
+        parser.add_argument('--host', default='localhost', help='Host header sent with each request.')
+        parser.add_argument('--skip-load', action='store_true', help='Only run the micro-benchmarks.')
+        parser.add_argument('--output', help='Write the results to this JSON file.')
+        parser.add_argument('--compare', help='JSON results of an earlier run to compare against.')
+
+    def handle(self, *args, **options):
+        results = {
+            'commit': get_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'json_backend': settings.JSON_BACKEND,
+            'dataset': {'inventory': Inventory.objects.count(), 'orders': Order.all_objects.count()},
+            'micro': {},
+            'load': {},
+        }
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as file:
+                baseline = json.load(file)
+
+        self.stdout.write(
+            f'commit {results["commit"]}, {results["dataset"]["inventory"]} inventory items, '
+            f'{results["dataset"]["orders"]} orders, JSON backend {results["json_backend"]}'
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Micro-benchmarks'))
+        for name, (operations, function) in get_micro_benchmarks(options['rows']).items():
+            seconds = best_of(options['repeat'], function)
+            result = results['micro'][name] = {
+                'operations': operations,
+                'seconds': seconds,
+                'us_per_operation': seconds / max(operations, 1) * 1e6,
+            }
+            self.stdout.write(
+                f'{name}: {result["us_per_operation"]:.1f} us/op over {operations} ops'
+                + self.compare(baseline, 'micro', name, result, 'us_per_operation', lower_is_better=True)
+            )
+
+        if not options['skip_load']:
+            self.run_load(results, baseline, options)
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(results, file, indent=2)
+                file.write('\n')
+            self.stdout.write(f'Wrote {options["output"]}')
+
+    def run_load(self, results: dict, baseline: dict, options: dict):
+        # Every request is profiled, which is how queries per request are
+        # counted; the applications must be built after the override.
+        with override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_SERVER_TIMING=False):
+            from config.asgi import application as asgi_application
+            from config.wsgi import application as wsgi_application
+
+        runners = {
+            'wsgi': lambda path, query_string: run_wsgi_load(
+                wsgi_application, path, options['concurrency'], options['requests'], query_string, options['host'],
+            ),
+            'asgi': lambda path, query_string: run_asgi_load(
+                asgi_application, path, options['concurrency'], options['requests'], query_string, options['host'],
+            ),
+        }
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Load'))
+        for server in options['servers']:
+            for url in options['paths'] or self.paths:
+                path, _, query_string = url.format(today=date.today().isoformat()).partition('?')
+                registry.clear()
+                result = runners[server](path, query_string)
+                queries, count = registry.total('request_queries')
+                result['queries_per_request'] = queries / count if count else 0
+
+                name = f'{server} {url}'
+                results['load'][name] = result
+                self.stdout.write(
+                    f'{name}: {result["throughput"]:.0f} req/s, {format_percentiles(result)}, '
+                    f'{result["queries_per_request"]:.1f} queries/req, statuses {result["statuses"]}'
+                    + self.compare(baseline, 'load', name, result, 'throughput', lower_is_better=False)
+                )
+
+    @staticmethod
+    def compare(baseline: dict, section: str, name: str, result: dict, key: str, lower_is_better: bool) -> str:
+        previous = (baseline or {}).get(section, {}).get(name)
+        if not previous or not previous.get(key):
+            return ''
+
+        change = (result[key] - previous[key]) / previous[key] * 100
+        better = change < 0 if lower_is_better else change > 0
+
+        return f' ({change:+.1f}% vs {baseline.get("commit")}, {"better" if better else "worse"})'
@@ -0,0 +1,180 @@
+import random
+import re
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from interview.core.fixtures import INVENTORY_ITEMS, INVENTORY_LANGUAGES, INVENTORY_TAGS, INVENTORY_TYPES, ORDER_TAGS, ORDERS
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+from interview.order.models import Order, OrderTag
+from interview.order.summary import rebuild_order_summary
+
+
+class Command(BaseCommand):
+    help = 'Seeds the reference data and, with --scale, synthetic inventory and orders for load testing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=0,
+            help='Number of synthetic inventory items to generate.',
+        )
+        parser.add_argument(
+            '--orders-per-item',
+            type=int,
+            default=1,
+            help='Number of synthetic orders to generate for each synthetic inventory item.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Number of inventory items inserted per transaction.',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for the synthetic data.',
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.seed_fixtures()
+
+        if options['scale'] > 0:
+            self.seed_synthetic(options['scale'], options['orders_per_item'], random.Random(options['seed']))
+
+        # The order tags are inserted in bulk, which skips the summary signals.
+        self.stdout.write(f'Rebuilt the order summary with {rebuild_order_summary()} rows')
+
+    def seed_fixtures(self):
+        today = date.today()
+
+        with transaction.atomic():
+            languages = self.ensure_names(InventoryLanguage, INVENTORY_LANGUAGES.values())
+            inventory_tags = self.ensure_names(InventoryTag, INVENTORY_TAGS)
+            types = self.ensure_names(InventoryType, INVENTORY_TYPES)
+            order_tags = self.ensure_names(OrderTag, ORDER_TAGS)
+
+            existing = set(
+                Inventory.objects.filter(name__in=[item['name'] for item in INVENTORY_ITEMS]).values_list('name', flat=True)
+            )
+            items = [item for item in INVENTORY_ITEMS if item['name'] not in existing]
+            inventories = self.create_inventories([
+                Inventory(
+                    name=item['name'],
+                    type_id=types[item['type']],
+                    language_id=languages[item['language']],
+                    metadata=item['metadata'],
+                )
+                for item in items
+            ])
+            self.add_inventory_tags(
+                (inventory.id, inventory_tags[name])
+                for inventory, item in zip(inventories, items)
+                for name in item['tags']
+            )
+
+            inventory_ids = {inventory.name: inventory.id for inventory in inventories}
+            order_items = [order for order in ORDERS if order['inventory'] in inventory_ids]
+            orders = Order.objects.bulk_create([
+                Order(
+                    inventory_id=inventory_ids[order['inventory']],
+                    start_date=today + timedelta(days=order['start_offset']),
+                    embargo_date=today + timedelta(days=order['embargo_offset']),
+                    is_active=order.get('is_active', True),
+                )
+                for order in order_items
+            ])
+            self.add_order_tags(
+                (order.id, order_tags[name])
+                for order, item in zip(orders, order_items)
+                for name in item['tags']
+            )
+
+        self.stdout.write(f'Seeded {len(inventories)} inventory items and {len(orders)} orders from fixtures')
+
+    def seed_synthetic(self, count: int, orders_per_item: int, rng: random.Random):
+        type_ids = list(InventoryType.objects.values_list('id', flat=True))
+        language_ids = list(InventoryLanguage.objects.values_list('id', flat=True))
+        inventory_tag_ids = list(InventoryTag.all_objects.values_list('id', flat=True))
+        order_tag_ids = list(OrderTag.all_objects.values_list('id', flat=True))
+        actors = sorted({actor for item in INVENTORY_ITEMS for actor in item['metadata']['actors']})
+        # Titles mix words from the fixture titles and actors, so searches match
+        # a realistic share of the catalog rather than every synthetic item.
+        title_words = sorted({word for text in [*actors, *(item['name'] for item in INVENTORY_ITEMS)] for word in re.findall(r'[^\W_]+', text)})
+        today = date.today()
+
+        for offset in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - offset)
+
+            with transaction.atomic():
+                inventories = self.create_inventories([
+                    Inventory(
+                        name=f'{" ".join(rng.sample(title_words, rng.randint(1, 3)))} {offset + n + 1}',
+                        type_id=rng.choice(type_ids),
+                        language_id=rng.choice(language_ids),
+                        metadata=dict(
+                            year=rng.randint(1950, today.year),
+                            actors=rng.sample(actors, 3),
+                            imdb_rating=round(rng.uniform(1, 10), 1),
+                            rotten_tomatoes_rating=rng.randint(0, 100),
+                        ),
+                    )
+                    for n in range(size)
+                ])
+                self.add_inventory_tags(
+                    (inventory.id, tag_id)
+                    for inventory in inventories
+                    for tag_id in rng.sample(inventory_tag_ids, rng.randint(1, 3))
+                )
+
+                orders = []
+                for inventory in inventories:
+                    for _ in range(orders_per_item):
+                        start_date = today + timedelta(days=rng.randint(-365, 365))
+                        orders.append(Order(
+                            inventory_id=inventory.id,
+                            start_date=start_date,
+                            embargo_date=start_date + timedelta(days=rng.randint(1, 90)),
+                            is_active=rng.random() >= 0.1,
+                        ))
+                orders = Order.objects.bulk_create(orders)
+                self.add_order_tags(
+                    (order.id, tag_id)
+                    for order in orders
+                    for tag_id in rng.sample(order_tag_ids, rng.randint(1, 4))
+                )
+
+            self.stdout.write(f'Seeded {offset + size}/{count} synthetic inventory items')
+
+    @staticmethod
+    def create_inventories(inventories: list[Inventory]) -> list[Inventory]:
+        for inventory in inventories:
+            inventory.sync_metadata_columns()
+
+        return Inventory.objects.bulk_create(inventories)
+
+    @staticmethod
+    def ensure_names(model, names) -> dict:
+        names = list(names)
+        model._default_manager.bulk_create([model(name=name) for name in names], ignore_conflicts=True)
+
+        return dict(model._default_manager.filter(name__in=names).values_list('name', 'id'))
+
+    @staticmethod
+    def add_inventory_tags(pairs):
+        through = Inventory.tags.through
+        through.objects.bulk_create(
+            [through(inventory_id=inventory_id, inventorytag_id=tag_id) for inventory_id, tag_id in pairs]
+        )
+
+    @staticmethod
+    def add_order_tags(pairs):
+        through = Order.tags.through
+        through.objects.bulk_create(
+            [through(order_id=order_id, ordertag_id=tag_id) for order_id, tag_id in pairs]
+        )
@@ -0,0 +1,159 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class PagePagination(BasePagination):
+    """
+    Base for paginators that fetch one row past the page to tell whether
+    there is a next one, and respond with `{'next': url, 'results': [...]}`.
+    Subclasses implement `get_next_link` for their own kind of link.
+    """
+    page_size_query_param = 'page_size'
+    page_size = 100
+    max_page_size = 1000
+
+    def set_page(self, results: list):
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        return self.page
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+
+class KeysetPagination(PagePagination):
+    """
+    Paginates on the `(created_at, id)` key of a `TimestampedModel` queryset.
+
+    Each page is fetched with a range condition on the composite index rather
+    than an OFFSET, so every page costs the same no matter how deep it is.
+    The cursor handed to the client is an opaque token for the last row seen.
+    """
+    cursor_query_param = 'cursor'
+    ordering = ('created_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request: Request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request: Request, view=None):
+        return self.set_page([item async for item in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset, request: Request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        if cursor is not None:
+            created_at, pk = cursor
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk),
+                created_at__gte=created_at,
+            )
+
+        return queryset[:self.page_size + 1]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(*self.get_position(self.page[-1])))
+
+    def get_position(self, item) -> tuple:
+        """
+        Returns the `(created_at, id)` key of a page item, which is either a
+        model instance or the key tuple itself.
+        """
+        if isinstance(item, tuple):
+            return item
+
+        return item.created_at, item.pk
+
+    def encode_cursor(self, created_at: datetime, pk: int) -> str:
+        payload = json.dumps([created_at.isoformat(), pk]).encode('ascii')
+
+        return urlsafe_b64encode(payload).decode('ascii')
+
+    def decode_cursor(self, request: Request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            created_at, pk = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            return datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError, UnicodeError, OverflowError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class OffsetPagination(PagePagination):
+    """
+    Paginates with LIMIT/OFFSET, for querysets ordered by something no index
+    can seek to, such as a search rank. The caller orders the queryset. Deep
+    pages cost as much as every page before them, so `offset` is capped.
+    """
+    offset_query_param = 'offset'
+    page_size = 20
+    max_page_size = 100
+    max_offset = 1000
+    invalid_offset_message = 'Invalid offset'
+
+    def paginate_queryset(self, queryset, request: Request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    def get_page_queryset(self, queryset, request: Request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.offset = self.get_offset(request)
+
+        return queryset[self.offset:self.offset + self.page_size + 1]
+
+    def get_offset(self, request: Request) -> int:
+        try:
+            offset = int(request.query_params.get(self.offset_query_param, 0))
+        except ValueError:
+            raise NotFound(self.invalid_offset_message)
+
+        if not 0 <= offset <= self.max_offset:
+            raise NotFound(self.invalid_offset_message)
+
+        return offset
+
+    def get_next_link(self):
+        offset = self.offset + self.page_size
+        if not self.has_next or offset > self.max_offset:
+            return None
+
+        return replace_query_param(self.request.build_absolute_uri(), self.offset_query_param, offset)
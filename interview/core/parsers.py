@@ -0,0 +1,45 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from interview.core.encoding import loads
+from interview.core.renderers import FastJSONRenderer
+
+
+class FastJSONParser(JSONParser):
+    """
+    `JSONParser` that decodes through the backend chosen by the
+    `JSON_BACKEND` setting. Bodies in a charset other than UTF-8 are still
+    parsed by `JSONParser` itself.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON into a list with one entry per non-blank line.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            reader = codecs.getreader(encoding)(stream)
+            return [loads(line) for line in reader if line.strip()]
+        except ValueError as exc:
+            raise ParseError(f'NDJSON parse error - {exc}')
@@ -0,0 +1,261 @@
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+SPANS = ('serialize', 'render')
+
+# Upper bounds of the histogram buckets, as Prometheus `le` labels.
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, 1000)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Name, help text and buckets of each histogram recorded per endpoint.
+METRICS = (
+    ('request_duration_seconds', 'Time spent handling the request.', SECONDS_BUCKETS),
+    ('request_queries', 'Number of SQL queries run by the request.', QUERY_BUCKETS),
+    ('request_sql_seconds', 'Time spent running SQL queries.', SECONDS_BUCKETS),
+    ('request_serialize_seconds', 'Time spent serializing, excluding SQL.', SECONDS_BUCKETS),
+    ('request_render_seconds', 'Time spent rendering the response body.', SECONDS_BUCKETS),
+    ('response_size_bytes', 'Size of the response body.', SIZE_BUCKETS),
+)
+METRIC_PREFIX = 'interview_'
+
+current_profile = ContextVar('current_profile', default=None)
+
+
+class Profile:
+    """
+    Timings of one sampled request. `profile_query` hands it every query
+    run in the request's context, which it counts and times.
+    """
+    __slots__ = ('queries', 'sql', 'spans')
+
+    def __init__(self):
+        self.queries = 0
+        self.sql = 0.0
+        self.spans = dict.fromkeys(SPANS, 0.0)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql += time.perf_counter() - start
+
+
+def profile_query(execute, sql, params, many, context):
+    """
+    Execute wrapper kept on every connection by `install_query_profiler`:
+    passes each query to the current request's profile, if it is sampled.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    return profile(execute, sql, params, many, context)
+
+
+def install_query_profiler():
+    """
+    Adds `profile_query` to this thread's connections. Async views run their
+    queries on a worker thread, whose connections are separate from the
+    event loop thread's, so this has to run there too. It goes first in
+    `execute_wrappers`, since `connection.execute_wrapper()` pops the last.
+    """
+    for connection in connections.all():
+        if profile_query not in connection.execute_wrappers:
+            connection.execute_wrappers.insert(0, profile_query)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Adds the time spent in the block, less any SQL it ran, to `name` on the
+    current request's profile. Costs one context variable lookup when the
+    request is not sampled.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    sql = profile.sql
+    try:
+        yield
+    finally:
+        profile.spans[name] += time.perf_counter() - start - (profile.sql - sql)
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'sum')
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self):
+        total = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            total += count
+            yield bound, total
+
+
+class Registry:
+    """
+    In-process histograms keyed by metric and `(endpoint, method)`. Each
+    worker process keeps its own, so scrape every worker.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {name: {} for name, _, _ in METRICS}
+
+    def observe(self, labels: tuple, values: dict):
+        with self.lock:
+            for name, _, buckets in METRICS:
+                histogram = self.histograms[name].get(labels)
+                if histogram is None:
+                    histogram = self.histograms[name][labels] = Histogram(buckets)
+                histogram.observe(values[name])
+
+    def total(self, name: str) -> tuple:
+        """
+        The sum and count of `name` over every endpoint.
+        """
+        with self.lock:
+            histograms = self.histograms[name].values()
+            return sum(histogram.sum for histogram in histograms), sum(sum(histogram.counts) for histogram in histograms)
+
+    def clear(self):
+        with self.lock:
+            for histograms in self.histograms.values():
+                histograms.clear()
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for name, description, _ in METRICS:
+                metric = METRIC_PREFIX + name
+                lines.append(f'# HELP {metric} {description}')
+                lines.append(f'# TYPE {metric} histogram')
+                for (endpoint, method), histogram in sorted(self.histograms[name].items()):
+                    labels = f'endpoint="{escape_label(endpoint)}",method="{method}"'
+                    for bound, count in histogram.samples():
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{{labels}}} {sum(histogram.counts)}')
+
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def get_endpoint(request) -> str:
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+
+    return match.route or match.view_name
+
+
+def get_response_size(response) -> int:
+    if response.streaming:
+        return 0
+
+    return len(response.content)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a `PROFILING_SAMPLE_RATE` share of requests: query count, SQL
+    time, serializer and render time (through `span`) and response size,
+    observed into the per-endpoint histograms `MetricsView` exposes. With
+    `PROFILING_SERVER_TIMING` the same timings are sent back in a
+    `Server-Timing` header. Unsampled requests only cost a random draw and
+    a context variable lookup per query.
+
+    Runs in either mode, so under ASGI it does not force the async views
+    onto a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.server_timing = settings.PROFILING_SERVER_TIMING
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        install_query_profiler()
+        start = time.perf_counter()
+        with self.profiling() as profile:
+            response = self.get_response(request)
+
+        return self.record(request, response, profile, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not self.is_sampled():
+            return await self.get_response(request)
+
+        await sync_to_async(install_query_profiler)()
+        start = time.perf_counter()
+        with self.profiling() as profile:
+            response = await self.get_response(request)
+
+        return self.record(request, response, profile, time.perf_counter() - start)
+
+    def is_sampled(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def profiling(self):
+        profile = Profile()
+        token = current_profile.set(profile)
+        try:
+            yield profile
+        finally:
+            current_profile.reset(token)
+
+    def record(self, request, response, profile, duration: float):
+        registry.observe((get_endpoint(request), request.method), {
+            'request_duration_seconds': duration,
+            'request_queries': profile.queries,
+            'request_sql_seconds': profile.sql,
+            'request_serialize_seconds': profile.spans['serialize'],
+            'request_render_seconds': profile.spans['render'],
+            'response_size_bytes': get_response_size(response),
+        })
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'sql;dur={profile.sql * 1000:.2f};desc="{profile.queries} queries"',
+                *(f'{name};dur={profile.spans[name] * 1000:.2f}' for name in SPANS),
+                f'total;dur={duration * 1000:.2f}',
+            ])
+
+        return response
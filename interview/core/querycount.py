@@ -0,0 +1,89 @@
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+
+BUDGETS_PATH = Path(__file__).with_name('query_budgets.json')
+SKIPPED_NAMESPACES = ('admin',)
+
+
+def get_routes(patterns=None, prefix: str = '') -> list[tuple]:
+    """
+    Returns `(route, view class)` for every URL pattern under the root
+    URLconf, with routes written the way they are declared
+    (`inventory/<int:id>/`). Namespaced apps such as the admin are skipped.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    routes = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace not in SKIPPED_NAMESPACES:
+                routes.extend(get_routes(pattern.url_patterns, prefix + str(pattern.pattern)))
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, 'view_class', None)
+            routes.append((prefix + str(pattern.pattern), view_class))
+
+    return routes
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def get_path(route: str, view_class, entry: dict) -> str:
+    """
+    Fills the converters of `route`: `id` with the first primary key of the
+    view's `queryset` model, anything else from the entry's `kwargs`.
+    """
+    kwargs = dict(entry.get('kwargs', {}))
+    queryset = getattr(view_class, 'queryset', None)
+    if 'id' not in kwargs and queryset is not None:
+        kwargs['id'] = queryset.model._default_manager.order_by('pk').values_list('pk', flat=True).first()
+
+    path = route
+    while '<' in path:
+        start = path.index('<')
+        end = path.index('>', start)
+        name = path[start + 1:end].split(':')[-1]
+        path = path[:start] + str(kwargs[name]) + path[end + 1:]
+
+    return '/' + path
+
+
+def get_query_string(entry: dict, today: date = None) -> str:
+    """
+    The entry's `query`, with `{today}` and `{today+N}` replaced by ISO dates.
+    """
+    today = today or date.today()
+    query = entry.get('query', '')
+    while '{today' in query:
+        start = query.index('{today')
+        end = query.index('}', start)
+        offset = query[start + len('{today'):end]
+        query = query[:start] + (today + timedelta(days=int(offset or 0))).isoformat() + query[end + 1:]
+
+    return query
+
+
+def count_queries(client: Client, path: str, query_string: str = '') -> tuple[int, int]:
+    """
+    Returns the status and the number of queries of a cold GET of `path`:
+    caches are cleared first and streamed bodies are consumed.
+    """
+    for cache in caches.all():
+        cache.clear()
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(f'{path}?{query_string}' if query_string else path, HTTP_ACCEPT='application/json')
+        if response.streaming:
+            b''.join(response.streaming_content)
+
+    return response.status_code, len(context.captured_queries)
@@ -0,0 +1,33 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from interview.core.encoding import dumps
+from interview.core.profiling import span
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` that encodes through the backend chosen by the
+    `JSON_BACKEND` setting. Indented output (the browsable API or an
+    `indent` media type parameter) and non-default JSON settings are still
+    rendered by `JSONRenderer` itself.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with span('render'):
+            return self.render_data(data, accepted_media_type, renderer_context)
+
+    def render_data(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if (
+            self.get_indent(accepted_media_type, renderer_context or {}) is not None
+            or self.encoder_class is not JSONEncoder
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return dumps(data)
@@ -0,0 +1,47 @@
+from rest_framework import serializers
+
+from interview.core.profiling import span
+
+
+class ProfiledListSerializer(serializers.ListSerializer):
+
+    @property
+    def data(self):
+        with span('serialize'):
+            return super().data
+
+
+class ProfiledModelSerializer(serializers.ModelSerializer):
+    """
+    A ModelSerializer whose `.data` counts towards the request's `serialize`
+    span, as `FastPathSerializer` does. Subclasses extend
+    `ProfiledModelSerializer.Meta` so that `many=True` is timed as well.
+    """
+
+    class Meta:
+        list_serializer_class = ProfiledListSerializer
+
+    @property
+    def data(self):
+        with span('serialize'):
+            return super().data
+
+
+class SetActiveSerializer(serializers.Serializer):
+    """
+    Body of a bulk activation request: the flag to set and which rows to set
+    it on, by `ids` and/or the filters subclasses declare. At least one
+    selector is required, so an empty body never touches every row.
+    """
+    is_active = serializers.BooleanField()
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, required=False)
+    
+    def validate(self, data: dict) -> dict:
+        if data.keys() == {'is_active'}:
+            raise serializers.ValidationError('Select rows with ids or a filter')
+        
+        return data
+
+
+class NameSetActiveSerializer(SetActiveSerializer):
+    name = serializers.ListField(child=serializers.CharField(), allow_empty=False, required=False, source='names')
@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from interview.core.behaviors import UniqueNameModel, get_name_cache, post_set_active
+from interview.core.cache import invalidate_model_cache
+
+
+def clear_name_cache(sender, **kwargs):
+    """
+    Clears this process's name cache right away, so the writing transaction
+    sees its own change, and moves the shared version forward once the change
+    is committed, which clears the caches of every other process within
+    `NAME_CACHE_VERSION_TTL` and of this one on its next lookup.
+    """
+    if issubclass(sender, UniqueNameModel):
+        cache = get_name_cache(sender)
+        cache.clear()
+        invalidate_model_cache(sender)
+        transaction.on_commit(cache.expire)
+
+
+post_save.connect(clear_name_cache, dispatch_uid='clear-name-cache-save')
+post_delete.connect(clear_name_cache, dispatch_uid='clear-name-cache-delete')
+post_set_active.connect(clear_name_cache, dispatch_uid='clear-name-cache-set-active')
@@ -1,3 +1,232 @@
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.db.models import Func, IntegerField, Subquery
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
 
-# Create your views here.
+from interview.core.cache import get_row_validators
+from interview.core.fieldsets import Fieldset
+from interview.core.profiling import registry
+
+
+def json_response(data, status: int = 200) -> HttpResponse:
+    """
+    Renders `data` the same way the API views do, for plain Django views that
+    cannot go through DRF (such as async views).
+    """
+    return HttpResponse(api_settings.DEFAULT_RENDERER_CLASSES[0]().render(data), content_type='application/json', status=status)
+
+
+async def ajson_response(build, status: int = 200) -> HttpResponse:
+    """
+    The `json_response` of the data `build()` returns, serialized and
+    rendered in a worker thread so that a large page does not hold up the
+    event loop. `build` works on instances already fetched and runs no
+    queries.
+    """
+    return await sync_to_async(lambda: json_response(build(), status=status), thread_sensitive=False)()
+
+
+def exception_response(exc: APIException) -> HttpResponse:
+    """
+    The `json_response` DRF's exception handler would give for `exc`.
+    """
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    
+    return json_response(data, status=exc.status_code)
+
+
+class ActiveQuerysetMixin:
+    """
+    Lists only active rows of an `IsActiveModel` unless the request opts in
+    with `?include_inactive=true`. Set `queryset` from `all_objects`.
+    """
+    include_inactive_query_param = 'include_inactive'
+    
+    def get_queryset(self):
+        queryset = self.queryset.all()
+        if self.include_inactive(self.request):
+            return queryset
+        
+        return queryset.filter(is_active=True)
+    
+    def include_inactive(self, request) -> bool:
+        return request.GET.get(self.include_inactive_query_param, '').lower() in ('1', 'true', 'yes')
+
+
+class FieldsetMixin:
+    """
+    Lets a request trim `serializer_class` with `?fields=` and `?expand=`
+    (see `Fieldset`). Without either, views serialize and fetch as before.
+    """
+    fields_query_param = 'fields'
+    expand_query_param = 'expand'
+    
+    def get_fieldset(self, request) -> Fieldset | None:
+        return Fieldset.from_query(
+            self.serializer_class(),
+            request.GET.get(self.fields_query_param),
+            request.GET.get(self.expand_query_param),
+        )
+    
+    def prune_queryset(self, queryset, fieldset: Fieldset | None, extra: tuple = ()):
+        if fieldset is None:
+            return queryset
+        
+        return fieldset.prune(queryset, self.serializer_class, extra)
+    
+    def get_fieldset_serializer(self, fieldset: Fieldset | None, *args, **kwargs):
+        serializer = self.serializer_class(*args, **kwargs)
+        if fieldset is not None:
+            fieldset.apply(serializer)
+        
+        return serializer
+
+
+class ConditionalGetMixin:
+    """
+    Answers conditional GETs with 304 Not Modified before anything is
+    serialized. Validators are computed from `validator_fields`, the
+    `updated_at` columns of each row and of the rows nested in it, and the
+    versions of `validator_models`, the lookups nested in responses: their
+    latest `updated_at` and row count, read in the same query so that no
+    shared cache has to track them.
+    
+    Views pass their queryset through `annotate_validators` first. A
+    conditional request then costs one query for the validators; otherwise
+    the view fetches them along with the response and calls
+    `set_validators`. List views with a `fast_path` and `pagination_class`
+    do all of this through `get_page_response`. Only detail responses carry
+    `Last-Modified`: a deletion can change a list page without moving any
+    timestamp forward.
+    """
+    validator_fields = ('updated_at',)
+    validator_models = ()
+    conditional_headers = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE')
+    
+    @property
+    def validator_annotations(self) -> dict:
+        annotations = {}
+        for model in self.validator_models:
+            rows = model._default_manager.order_by()
+            name = model._meta.model_name
+            annotations[f'{name}_modified'] = Subquery(rows.values(modified=Func('updated_at', function='MAX')))
+            annotations[f'{name}_count'] = Subquery(rows.values(count=Func('pk', function='COUNT', output_field=IntegerField())))
+        
+        return annotations
+    
+    @property
+    def validator_keys(self) -> tuple:
+        return ('pk', *self.validator_fields, *self.validator_annotations)
+    
+    def annotate_validators(self, queryset):
+        return queryset.annotate(**self.validator_annotations)
+    
+    def get_not_modified(self, request, queryset, detail: bool = False) -> HttpResponse | None:
+        """
+        The 304 (or 412) response for a conditional request on the rows of
+        `queryset`, or None when the view should respond as usual. For a
+        `detail` view, a request on a missing row raises NotFound.
+        """
+        if not any(header in request.META for header in self.conditional_headers):
+            return None
+        
+        rows = list(queryset.values_list(*self.validator_keys))
+        if detail and not rows:
+            raise NotFound()
+        
+        etag, timestamp = self.get_validators(request, rows, detail)
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            self.add_validator_headers(response, etag, timestamp)
+        
+        return response
+    
+    def get_page_response(self, request, queryset, fieldset: Fieldset | None, extra: tuple = ()) -> HttpResponse:
+        """
+        The page of `queryset` that `pagination_class` selects, serialized by
+        `fast_path` with its validators, or the 304 for a conditional request.
+        Each item also carries the `extra` annotations of its row, such as a
+        search `rank`.
+        """
+        paginator = self.pagination_class()
+        position = getattr(paginator, 'ordering', ())
+        keys = (*position, *extra, *self.validator_keys)
+        queryset = paginator.get_page_queryset(self.annotate_validators(queryset), request)
+        not_modified = self.get_not_modified(request, queryset)
+        if not_modified is not None:
+            return not_modified
+        
+        rows = [(dict(zip(keys, values)), data) for values, data in self.fast_path.serialize(queryset, keys=keys, fieldset=fieldset)]
+        paginator.set_page([tuple(row[key] for key in position) for row, _ in rows])
+        response = paginator.get_paginated_response([
+            {**data, **{key: row[key] for key in extra}} for row, data in rows[:paginator.page_size]
+        ])
+        
+        return self.set_validators(response, request, [tuple(row[key] for key in self.validator_keys) for row, _ in rows])
+    
+    def set_validators(self, response, request, rows, detail: bool = False):
+        self.add_validator_headers(response, *self.get_validators(request, rows, detail))
+        
+        return response
+    
+    def get_validators(self, request, rows, detail: bool) -> tuple[str, int | None]:
+        etag, modified = get_row_validators(request, rows)
+        if not detail or modified is None:
+            return etag, None
+        
+        return etag, int(modified.timestamp())
+    
+    @staticmethod
+    def add_validator_headers(response, etag: str, timestamp: int = None):
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+
+
+class SetActiveView(APIView):
+    """
+    Sets `is_active` on every `IsActiveModel` row the request selects with a
+    single UPDATE and returns how many rows changed. Subclasses set
+    `queryset` and `serializer_class` and map extra filters in
+    `filter_queryset`.
+    """
+    queryset = None
+    serializer_class = None
+    
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+        
+        filters = dict(serializer.validated_data)
+        is_active = filters.pop('is_active')
+        pks = filters.pop('ids', None)
+        queryset = self.filter_queryset(self.get_queryset(), **filters)
+        updated = self.queryset.model.set_active(is_active, pks=pks, queryset=queryset)
+        
+        return Response({'updated': updated}, status=200)
+    
+    def get_queryset(self):
+        return self.queryset.all()
+    
+    def filter_queryset(self, queryset, names: list[str] = None):
+        if names:
+            queryset = queryset.filter(name__in=names)
+        
+        return queryset
+
+
+class MetricsView(View):
+    """
+    The profiling histograms of this process in the Prometheus text format.
+    """
+    
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,57 @@
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
+
+from interview.core.pagination import KeysetPagination
+from interview.core.views import FieldsetMixin, ajson_response, exception_response, json_response
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import InventoryFilterSerializer, InventorySerializer
+
+
+class InventoryAsyncListView(FieldsetMixin, View):
+    queryset = Inventory.objects.with_related()
+    serializer_class = InventorySerializer
+    pagination_class = KeysetPagination
+    
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        filters = InventoryFilterSerializer(data=request.GET)
+        if not filters.is_valid():
+            return json_response(filters.errors, status=400)
+        
+        try:
+            fieldset = self.get_fieldset(request)
+        except ValidationError as e:
+            return json_response(e.detail, status=400)
+        
+        paginator = self.pagination_class()
+        try:
+            page = await paginator.apaginate_queryset(
+                self.prune_queryset(self.queryset, fieldset, extra=paginator.ordering).filter_metadata(**filters.validated_data),
+                Request(request),
+                view=self,
+            )
+        except APIException as e:
+            return exception_response(e)
+        
+        return await ajson_response(
+            lambda: paginator.get_paginated_response(self.get_fieldset_serializer(fieldset, page, many=True).data).data,
+        )
+
+
+class InventoryAsyncRetrieveView(FieldsetMixin, View):
+    queryset = Inventory.objects.with_related()
+    serializer_class = InventorySerializer
+    
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        try:
+            fieldset = self.get_fieldset(request)
+        except ValidationError as e:
+            return json_response(e.detail, status=400)
+        
+        try:
+            inventory = await self.prune_queryset(self.queryset, fieldset).aget(id=kwargs['id'])
+        except Inventory.DoesNotExist:
+            return json_response({'detail': 'Not found.'}, status=404)
+        
+        return await ajson_response(lambda: self.get_fieldset_serializer(fieldset, inventory).data)
@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+
+from interview.core.benchmarks import best_of, without_indexes
+from interview.inventory.models import Inventory
+from interview.inventory.search import SEARCH_ORDERING
+from interview.inventory.views import InventorySearchView
+
+
+class Command(BaseCommand):
+    help = 'Times the first page of inventory searches against the icontains scan they replace and prints their query plans.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs per scenario.')
+        parser.add_argument('--page-size', type=int, default=20, help='Number of results per page.')
+        parser.add_argument(
+            '--candidates',
+            type=int,
+            default=InventorySearchView.max_candidates,
+            help='Number of matches ranked per search, as the search endpoint does.',
+        )
+        parser.add_argument(
+            'queries',
+            nargs='*',
+            default=['mat', 'matr', 'lord ring', 'reeves', 'keanu ree', 'titanic', '1999999'],
+            help='Search texts to time.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Inventory search uses PostgreSQL full-text search and pg_trgm; run this against PostgreSQL.')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Inventory._meta.db_table}')
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            matches = ['prefix', 'fuzzy'] if cursor.fetchone() else ['prefix']
+
+        size = options['page_size']
+        self.stdout.write(
+            f'{Inventory.objects.count()} inventory items, {size} results per page, '
+            f'{options["candidates"]} candidates ranked'
+        )
+        for text in options['queries']:
+            contains = Q()
+            for word in text.split():
+                contains &= Q(name__icontains=word) | Q(metadata__actors__icontains=word)
+            scan = Inventory.objects.filter(contains).order_by('id').values_list('id', flat=True)[:size + 1]
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f'\n{text!r}: unranked icontains first page best {best_of(options["repeat"], lambda: len(scan.all())) * 1000:.1f} ms'
+            ))
+
+            for match in matches:
+                ranked = {
+                    'all matches': Inventory.objects.search(text, match=match),
+                    'candidates': Inventory.objects.search(text, match=match, candidates=options['candidates']),
+                }
+                count = ranked['all matches'].count()
+                for label, queryset in ranked.items():
+                    page = queryset.order_by(*SEARCH_ORDERING).values_list('id', flat=True)[:size + 1]
+                    indexed = best_of(options['repeat'], lambda: len(page.all()))
+                    with without_indexes():
+                        scanned = best_of(options['repeat'], lambda: len(page.all()))
+                    self.stdout.write(
+                        f'{match}, {label}: {count} matches, first page best {indexed * 1000:.1f} ms with indexes, '
+                        f'{scanned * 1000:.1f} ms without ({scanned / indexed:.1f}x)'
+                    )
+                self.stdout.write(page.explain(analyze=True))
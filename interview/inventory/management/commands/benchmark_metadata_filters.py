@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from interview.core.benchmarks import best_of
+from interview.inventory.models import Inventory
+
+
+class Command(BaseCommand):
+    help = 'Times the inventory metadata filters against the current database and prints their query plans.'
+
+    scenarios = {
+        'year range': dict(year_min=1990, year_max=1999),
+        'imdb rating': dict(imdb_rating_min=8),
+        'rotten tomatoes rating': dict(rotten_tomatoes_rating_min=95),
+        'actor': dict(actors=['Keanu Reeves']),
+        'combined': dict(year_min=1990, year_max=1999, imdb_rating_min=8, actors=['Keanu Reeves']),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs per scenario.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The metadata indexes are PostgreSQL indexes; run this against PostgreSQL.')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Inventory._meta.db_table}')
+
+        self.stdout.write(f'{Inventory.objects.count()} inventory rows')
+        for name, filters in self.scenarios.items():
+            queryset = Inventory.objects.filter_metadata(**filters).values_list('id', flat=True)
+
+            elapsed = best_of(options['repeat'], lambda: len(queryset.all()))
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{name}: {filters}'))
+            self.stdout.write(f'{queryset.count()} rows, best {elapsed * 1000:.1f} ms of {options["repeat"]} runs')
+            self.stdout.write(queryset.explain(analyze=True))
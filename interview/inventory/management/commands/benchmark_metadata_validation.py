@@ -0,0 +1,94 @@
+import json
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+from pydantic import ValidationError
+from rest_framework import serializers
+
+from interview.core.benchmarks import best_of
+from interview.core.fields import SchemaField, get_error_detail
+from interview.core.fixtures import INVENTORY_ITEMS
+from interview.inventory.schemas import InventoryMetaData
+from interview.inventory.serializers import InventoryBulkItemSerializer
+from interview.inventory.views import InventoryBulkCreateView
+
+
+class Command(BaseCommand):
+    help = 'Checks SchemaField against the previous InventoryMetaData validation and compares their per-item cost.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=20000, help='Number of metadata payloads validated per run.')
+        parser.add_argument('--invalid', type=float, default=0.05, help='Share of payloads that fail validation.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for the payloads.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        payloads = [self.make_payload(rng, rng.random() < options['invalid']) for _ in range(options['items'])]
+        field = SchemaField(InventoryMetaData)
+
+        validated, errors = field.validate_many(payloads)
+        expected_validated, expected_errors = self.validate_previous(payloads)
+        if validated != expected_validated or errors != expected_errors:
+            raise CommandError('SchemaField results differ from InventoryMetaData(**data).json()')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'{len(payloads)} metadata payloads, {len(errors)} invalid, identical results'
+        ))
+        self.report('metadata', {
+            'InventoryMetaData(**data) + .json()': lambda: self.validate_previous(payloads),
+            'SchemaField.validate_many': lambda: field.validate_many(payloads),
+        }, len(payloads), options['repeat'])
+
+        items = [
+            {'name': f'Title {n}', 'type': 'Movie', 'language': 'English', 'tags': ['Action'], 'metadata': metadata}
+            for n, metadata in enumerate(payloads)
+        ]
+        self.report('bulk item', {
+            'serializer per item': lambda: self.validate_per_item(items, field),
+            'shared serializer, batched metadata': lambda: InventoryBulkCreateView().validate_items(items),
+        }, len(items), options['repeat'])
+
+    def report(self, name: str, pipelines: dict, count: int, repeat: int):
+        baseline = None
+        for label, function in pipelines.items():
+            elapsed = best_of(repeat, function)
+            baseline = baseline or elapsed
+            self.stdout.write(f'{name}: {label} {elapsed / count * 1e6:.1f} us/item ({baseline / elapsed:.1f}x)')
+
+    @staticmethod
+    def validate_previous(payloads: list) -> tuple[dict, dict]:
+        validated = {}
+        errors = {}
+        for index, data in enumerate(payloads):
+            try:
+                validated[index] = json.loads(InventoryMetaData(**data).json())
+            except ValidationError as e:
+                errors[index] = get_error_detail(e.errors())
+
+        return validated, errors
+
+    @staticmethod
+    def validate_per_item(items: list, field: SchemaField):
+        for item in items:
+            serializer = InventoryBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                try:
+                    field.run_validation(item['metadata'])
+                except serializers.ValidationError:
+                    pass
+
+    @staticmethod
+    def make_payload(rng: random.Random, invalid: bool) -> dict:
+        actors = [actor for item in INVENTORY_ITEMS for actor in item['metadata']['actors']]
+        payload = {
+            'year': rng.choice([rng.randint(1950, 2023), str(rng.randint(1950, 2023))]),
+            'actors': rng.sample(actors, 3),
+            'imdb_rating': rng.choice([round(rng.uniform(1, 10), 1), f'{rng.uniform(1, 10):.1f}', rng.randint(1, 10)]),
+            'rotten_tomatoes_rating': rng.randint(0, 100),
+        }
+        if invalid:
+            payload[rng.choice(['year', 'imdb_rating', 'rotten_tomatoes_rating'])] = 'unknown'
+            del payload[rng.choice(['actors', 'year'])]
+
+        return payload
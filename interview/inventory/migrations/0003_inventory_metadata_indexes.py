@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:07
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("inventory", "0002_inventory_inventory_created_at_id_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="inventory_metadata_gin_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
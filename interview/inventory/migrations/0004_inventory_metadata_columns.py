@@ -0,0 +1,30 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_inventory_metadata_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventory",
+            name="imdb_rating",
+            field=models.DecimalField(
+                decimal_places=1, editable=False, max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="inventory",
+            name="rotten_tomatoes_rating",
+            field=models.IntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="inventory",
+            name="year",
+            field=models.IntegerField(editable=False, null=True),
+        ),
+    ]
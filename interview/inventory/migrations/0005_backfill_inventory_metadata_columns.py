@@ -0,0 +1,111 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+from django.db.models import Case, DecimalField, Func, IntegerField, Max, Min, When
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Abs, Cast, Round
+from django.db.models.lookups import LessThan
+
+BATCH_SIZE = 10000
+INTEGER_PATTERN = r"^-?[0-9]{1,9}$"
+RATING_PATTERN = r"^-?[0-9]{1,2}(\.[0-9]+)?$"
+
+
+def metadata_column(key, pattern, output_field):
+    return Case(
+        When(
+            **{f"metadata__{key}__regex": pattern},
+            then=Cast(KeyTextTransform(key, "metadata"), output_field),
+        ),
+        default=None,
+        output_field=output_field,
+    )
+
+
+def rating_column(key, pattern):
+    """
+    Like `metadata_column`, but rounds the value to the one decimal the
+    column keeps first and stores NULL when that no longer fits its three
+    digits (99.95 rounds to 100.0), as `to_rating` does.
+    """
+    output_field = DecimalField(max_digits=3, decimal_places=1)
+    rounded = Round(
+        Func(
+            KeyTextTransform(key, "metadata"),
+            template="(%(expressions)s)::numeric",
+            output_field=DecimalField(),
+        ),
+        1,
+    )
+    return Case(
+        When(
+            **{f"metadata__{key}__regex": pattern},
+            then=Case(
+                When(LessThan(Abs(rounded), 100), then=Cast(rounded, output_field)),
+                default=None,
+                output_field=output_field,
+            ),
+        ),
+        default=None,
+        output_field=output_field,
+    )
+
+
+def backfill_metadata_columns(apps, schema_editor):
+    """
+    Copies the hot metadata keys onto the typed columns with one UPDATE per
+    primary key range, committing each range separately so no long-running
+    lock is held. Rows that already have a value are skipped, so an
+    interrupted run can be restarted.
+    """
+    alias = schema_editor.connection.alias
+    Inventory = apps.get_model("inventory", "Inventory")
+    pending = Inventory.objects.using(alias).filter(
+        year__isnull=True,
+        imdb_rating__isnull=True,
+        rotten_tomatoes_rating__isnull=True,
+    )
+
+    bounds = pending.aggregate(first=Min("id"), last=Max("id"))
+    if bounds["first"] is None:
+        return
+
+    for start in range(bounds["first"], bounds["last"] + 1, BATCH_SIZE):
+        with transaction.atomic(using=alias):
+            pending.filter(id__gte=start, id__lt=start + BATCH_SIZE).update(
+                year=metadata_column("year", INTEGER_PATTERN, IntegerField()),
+                imdb_rating=rating_column("imdb_rating", RATING_PATTERN),
+                rotten_tomatoes_rating=metadata_column(
+                    "rotten_tomatoes_rating", INTEGER_PATTERN, IntegerField()
+                ),
+            )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("inventory", "0004_inventory_metadata_columns"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_metadata_columns, reverse_code=migrations.RunPython.noop
+        ),
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=models.Index(fields=["year"], name="inventory_year_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=models.Index(
+                fields=["imdb_rating"], name="inventory_imdb_rating_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=models.Index(
+                fields=["rotten_tomatoes_rating"], name="inventory_rt_rating_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:50
+
+from django.db import migrations
+import django.db.models.manager
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0005_backfill_inventory_metadata_columns"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="inventorytag",
+            managers=[
+                ("all_objects", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,59 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, transaction
+from django.db.models import F, Max, Min
+
+from interview.inventory.search import search_vector
+
+BATCH_SIZE = 10000
+
+
+def backfill_search_vector(apps, schema_editor):
+    """
+    Builds the search vector from the name and actors with one UPDATE per
+    primary key range, committing each range separately, from the same
+    expression `Inventory.sync_metadata_columns` writes. Rows that already
+    have a vector are skipped, so an interrupted run can be restarted.
+    """
+    alias = schema_editor.connection.alias
+    Inventory = apps.get_model("inventory", "Inventory")
+    pending = Inventory.objects.using(alias).filter(search_vector__isnull=True)
+
+    bounds = pending.aggregate(first=Min("id"), last=Max("id"))
+    if bounds["first"] is None:
+        return
+
+    for start in range(bounds["first"], bounds["last"] + 1, BATCH_SIZE):
+        with transaction.atomic(using=alias):
+            pending.filter(id__gte=start, id__lt=start + BATCH_SIZE).update(
+                search_vector=search_vector(F("name"), F("metadata")),
+            )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("inventory", "0007_inventory_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_search_vector, reverse_code=migrations.RunPython.noop
+        ),
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="inventory_search_vector_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="inventory_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
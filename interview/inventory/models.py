@@ -1,10 +1,22 @@
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField, TrigramWordSimilarity
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Length
 
 from interview.core.behaviors import IsActiveModel, NameModel, TimestampedModel, UniqueNameModel
+from interview.inventory.search import SEARCH_CONFIG, search_vector
 
 
 class InventoryTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
-        
+    
+    class Meta(IsActiveModel.Meta):
+        # Nested tag lists render in a stable order on every code path.
+        ordering = ['id']
+    
     def __str__(self) -> str:
         return self.name
 
@@ -27,6 +39,90 @@ class InventoryType(UniqueNameModel, TimestampedModel, models.Model):
         return self.name
 
 
+def get_prefix_query(text: str, weights: str = ''):
+    """
+    A query matching rows that have a word starting with each word of `text`,
+    only among the words of the given `weights` if any (`'A'` for names), or
+    `None` when `text` has no letters or digits.
+    """
+    words = re.findall(r'[^\W_]+', text)
+    if not words:
+        return None
+    
+    return SearchQuery(' & '.join(f'{word}:*{weights}' for word in words), config=SEARCH_CONFIG, search_type='raw')
+
+
+def to_rating(text: str) -> Decimal | None:
+    """
+    `text` rounded half away from zero to the one decimal the `imdb_rating`
+    column keeps, as PostgreSQL would, or `None` when the result no longer
+    fits its three digits (99.95 rounds to 100.0).
+    """
+    rating = Decimal(text).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP)
+    
+    return rating if abs(rating) < 100 else None
+
+
+class InventoryQuerySet(models.QuerySet):
+
+    def with_related(self):
+        return self.select_related('type', 'language').prefetch_related('tags')
+    
+    def filter_metadata(
+        self,
+        year_min: int = None,
+        year_max: int = None,
+        imdb_rating_min: float = None,
+        rotten_tomatoes_rating_min: int = None,
+        actors: list[str] = None,
+    ):
+        queryset = self
+        if year_min is not None:
+            queryset = queryset.filter(year__gte=year_min)
+        if year_max is not None:
+            queryset = queryset.filter(year__lte=year_max)
+        if imdb_rating_min is not None:
+            queryset = queryset.filter(imdb_rating__gte=imdb_rating_min)
+        if rotten_tomatoes_rating_min is not None:
+            queryset = queryset.filter(rotten_tomatoes_rating__gte=rotten_tomatoes_rating_min)
+        if actors:
+            queryset = queryset.filter(metadata__contains={'actors': actors})
+        
+        return queryset
+    
+    def search(self, text: str, match: str = 'prefix', candidates: int = None):
+        """
+        Rows matching `text`, annotated with their `rank`. `prefix` matches the
+        words of `text` against the starts of words in names and actors, ranking
+        names higher; `fuzzy` matches names by trigram word similarity, so typos
+        are tolerated.
+        
+        Ranking reads every match, so `candidates` bounds the cost of broad
+        queries: only that many matches are ranked, picked by relevance with
+        cheap checks rather than by rank. Prefix candidates are matches on the
+        name first, then on actors, shorter names first within each; fuzzy
+        candidates are the most similar names. Ties go to the lowest ids, so
+        the same request always ranks the same rows.
+        """
+        if match == 'fuzzy':
+            matches = self.filter(name__trigram_word_similar=text)
+            rank = TrigramWordSimilarity(text, 'name')
+            relevance = (rank.desc(),)
+        else:
+            query = get_prefix_query(text)
+            if query is None:
+                return self.none()
+            matches = self.filter(search_vector=query)
+            rank = SearchRank(F('search_vector'), query)
+            relevance = (Case(When(search_vector=get_prefix_query(text, 'A'), then=0), default=1),)
+        
+        if candidates is not None:
+            best = matches.order_by(*relevance, Length('name'), 'pk')
+            matches = self.filter(pk__in=best.values('pk')[:candidates])
+        
+        return matches.annotate(rank=rank)
+
+
 class Inventory(NameModel, TimestampedModel, models.Model):
     type = models.ForeignKey(
         InventoryType,
@@ -40,13 +136,65 @@ class Inventory(NameModel, TimestampedModel, models.Model):
     )
     tags = models.ManyToManyField(InventoryTag, related_name='inventories')
     metadata = models.JSONField()
+    year = models.IntegerField(null=True, editable=False)
+    imdb_rating = models.DecimalField(max_digits=3, decimal_places=1, null=True, editable=False)
+    rotten_tomatoes_rating = models.IntegerField(null=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = InventoryQuerySet.as_manager()
+
+    # Metadata keys mirrored onto typed, indexed columns for filtering and sorting,
+    # with the conversion to its column type and the pattern a value must match;
+    # values that fail either are stored as NULL.
+    METADATA_COLUMNS = {
+        'year': (int, r'-?[0-9]{1,9}'),
+        'imdb_rating': (to_rating, r'-?[0-9]{1,2}(\.[0-9]+)?'),
+        'rotten_tomatoes_rating': (int, r'-?[0-9]{1,9}'),
+    }
     
     class Meta:
         verbose_name_plural = 'Inventories'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='inventory_created_at_id_idx'),
+            GinIndex(fields=['metadata'], opclasses=['jsonb_path_ops'], name='inventory_metadata_gin_idx'),
+            models.Index(fields=['year'], name='inventory_year_idx'),
+            models.Index(fields=['imdb_rating'], name='inventory_imdb_rating_idx'),
+            models.Index(fields=['rotten_tomatoes_rating'], name='inventory_rt_rating_idx'),
+            GinIndex(fields=['search_vector'], name='inventory_search_vector_idx'),
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='inventory_name_trgm_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name
     
+    def save(self, *args, **kwargs):
+        self.sync_metadata_columns()
+        if kwargs.get('update_fields') is not None:
+            update_fields = set(kwargs['update_fields'])
+            if 'metadata' in update_fields:
+                update_fields.update(self.METADATA_COLUMNS)
+            if update_fields & {'name', 'metadata'}:
+                update_fields.add('search_vector')
+            kwargs['update_fields'] = update_fields
+        
+        super().save(*args, **kwargs)
+    
+    def sync_metadata_columns(self):
+        """
+        Copies the hot metadata keys onto their typed columns and sets the
+        search vector from the name and actors. Call this before
+        `bulk_create`/`bulk_update`, which bypass `save`.
+        """
+        metadata = self.metadata if isinstance(self.metadata, dict) else {}
+        for key, (cast, pattern) in self.METADATA_COLUMNS.items():
+            value = metadata.get(key)
+            if isinstance(value, (int, float, str)) and re.fullmatch(pattern, str(value)):
+                setattr(self, key, cast(str(value)))
+            else:
+                setattr(self, key, None)
+        
+        self.search_vector = search_vector(Value(self.name), Value(self.metadata, output_field=models.JSONField()))
+    
     @classmethod
     def get_by_type(cls, type_id: int):
         return cls.objects.filter(type_id=type_id)
@@ -0,0 +1,38 @@
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Func, TextField
+from django.db.models.functions import Length
+
+# Text search configuration for names and actors: no stemming or stop words,
+# so any word can be typed ahead by its first letters.
+SEARCH_CONFIG = 'simple'
+
+# Order of `Inventory.objects.search` results: best rank first, then shorter
+# names, as candidates are picked, so an exact name wins a tie.
+SEARCH_ORDERING = ('-rank', Length('name'), 'id')
+
+
+class ActorsText(Func):
+    """
+    The `actors` array of a metadata expression as its elements joined with
+    spaces, in order; empty when `actors` is missing or not an array. The
+    backfill migration passes the `metadata` column and `save` the value
+    about to be written, so both index the same words.
+    """
+    template = (
+        "(SELECT COALESCE(string_agg(actor.value, ' ' ORDER BY actor.position), '') "
+        "FROM (SELECT (%(expressions)s)::jsonb -> 'actors' AS actors) AS metadata, "
+        "jsonb_array_elements_text(CASE WHEN jsonb_typeof(metadata.actors) = 'array' "
+        "THEN metadata.actors ELSE '[]'::jsonb END) WITH ORDINALITY AS actor(value, position))"
+    )
+    output_field = TextField()
+
+
+def search_vector(name, metadata):
+    """
+    The `search_vector` of a row from expressions for its name and metadata:
+    the name weighted above the actors.
+    """
+    return (
+        SearchVector(name, config=SEARCH_CONFIG, weight='A')
+        + SearchVector(ActorsText(metadata), config=SEARCH_CONFIG, weight='B')
+    )
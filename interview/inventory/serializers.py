@@ -1,35 +1,69 @@
+import re
+
 from rest_framework import serializers
 
+from interview.core.fields import SchemaField
+from interview.core.serializers import ProfiledModelSerializer
 from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
+from interview.inventory.schemas import InventoryMetaData
 
 
-class InventoryTagSerializer(serializers.ModelSerializer):
+class InventoryTagSerializer(ProfiledModelSerializer):
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = InventoryTag
         fields = ['id', 'name', 'is_active']
         
         
-class InventoryLanguageSerializer(serializers.ModelSerializer):
+class InventoryLanguageSerializer(ProfiledModelSerializer):
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = InventoryLanguage
         fields = ['id', 'name']
 
 
-class InventoryTypeSerializer(serializers.ModelSerializer):
+class InventoryTypeSerializer(ProfiledModelSerializer):
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = InventoryType
         fields = ['id', 'name']
 
 
-class InventorySerializer(serializers.ModelSerializer):
+class InventorySerializer(ProfiledModelSerializer):
     type = InventoryTypeSerializer()
     language = InventoryLanguageSerializer()
     tags = InventoryTagSerializer(many=True)
-    metadata = serializers.JSONField()
+    metadata = SchemaField(InventoryMetaData)
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = Inventory
-        fields = ['id', 'name', 'type', 'language', 'tags', 'metadata']
\ No newline at end of file
+        fields = ['id', 'name', 'type', 'language', 'tags', 'metadata']
+
+
+class InventoryFilterSerializer(serializers.Serializer):
+    year_min = serializers.IntegerField(required=False)
+    year_max = serializers.IntegerField(required=False)
+    imdb_rating_min = serializers.FloatField(required=False, min_value=0, max_value=10)
+    rotten_tomatoes_rating_min = serializers.IntegerField(required=False, min_value=0, max_value=100)
+    actor = serializers.ListField(child=serializers.CharField(), required=False, source='actors')
+
+
+class InventorySearchSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=255, source='text')
+    match = serializers.ChoiceField(choices=['prefix', 'fuzzy'], default='prefix')
+    
+    def validate_q(self, value: str) -> str:
+        if not re.search(r'[^\W_]', value):
+            raise serializers.ValidationError('Enter at least one letter or digit.')
+        
+        return value
+
+
+class InventoryBulkItemSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255)
+    type = serializers.CharField(max_length=255)
+    language = serializers.CharField(max_length=255)
+    tags = serializers.ListField(child=serializers.CharField(max_length=255), default=list)
+    # Checked against InventoryMetaData for the whole batch at once by
+    # InventoryBulkCreateView, with SchemaField.validate_many.
+    metadata = serializers.DictField()
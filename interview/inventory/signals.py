@@ -0,0 +1,7 @@
+from django.db.models.signals import m2m_changed
+
+from interview.core.behaviors import touch_m2m_owners
+from interview.inventory.models import Inventory
+
+
+m2m_changed.connect(touch_m2m_owners, sender=Inventory.tags.through, dispatch_uid='touch-inventory-tags')
@@ -1,6 +1,7 @@
 
 from django.urls import path
-from interview.inventory.views import InventoryLanguageListCreateView, InventoryLanguageRetrieveUpdateDestroyView, InventoryListCreateView, InventoryRetrieveUpdateDestroyView, InventoryTagListCreateView, InventoryTagRetrieveUpdateDestroyView, InventoryTypeListCreateView, InventoryTypeRetrieveUpdateDestroyView
+from interview.inventory.async_views import InventoryAsyncListView, InventoryAsyncRetrieveView
+from interview.inventory.views import InventoryBulkCreateView, InventoryExportView, InventoryLanguageListCreateView, InventoryLanguageRetrieveUpdateDestroyView, InventoryListCreateView, InventoryRetrieveUpdateDestroyView, InventorySearchView, InventoryTagListCreateView, InventoryTagRetrieveUpdateDestroyView, InventoryTagSetActiveView, InventoryTypeListCreateView, InventoryTypeRetrieveUpdateDestroyView
 from interview.order.views import OrderListCreateView, OrderTagListCreateView
 
 
@@ -10,7 +11,13 @@ urlpatterns = [
     path('tags/<int:id>/', InventoryTagRetrieveUpdateDestroyView.as_view(), name='inventory-tags-detail'),
     path('types/<int:id>/', InventoryTypeRetrieveUpdateDestroyView.as_view(), name='inventory-types-detail'),
     path('languages/', InventoryLanguageListCreateView.as_view(), name='inventory-languages-list'),
+    path('tags/active/', InventoryTagSetActiveView.as_view(), name='inventory-tags-set-active'),
     path('tags/', InventoryTagListCreateView.as_view(), name='inventory-tags-list'),
     path('types/', InventoryTypeListCreateView.as_view(), name='inventory-types-list'),
+    path('bulk/', InventoryBulkCreateView.as_view(), name='inventory-bulk'),
+    path('async/<int:id>/', InventoryAsyncRetrieveView.as_view(), name='inventory-async-detail'),
+    path('async/', InventoryAsyncListView.as_view(), name='inventory-async-list'),
+    path('export/', InventoryExportView.as_view(), name='inventory-export'),
+    path('search/', InventorySearchView.as_view(), name='inventory-search'),
     path('', InventoryListCreateView.as_view(), name='inventory-list'),
 ]
\ No newline at end of file
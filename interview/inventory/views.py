@@ -1,23 +1,36 @@
+import zlib
+
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.request import Request
+from rest_framework.serializers import as_serializer_error
 from rest_framework.views import APIView
 
+from interview.core.cache import cached_response
+from interview.core.encoding import dumps
+from interview.core.fastpath import FastPathSerializer
+from interview.core.fields import SchemaField
+from interview.core.pagination import KeysetPagination, OffsetPagination
+from interview.core.parsers import FastJSONParser, NDJSONParser
+from interview.core.serializers import NameSetActiveSerializer
+from interview.core.views import ActiveQuerysetMixin, ConditionalGetMixin, FieldsetMixin, SetActiveView
 from interview.inventory.models import Inventory, InventoryLanguage, InventoryTag, InventoryType
 from interview.inventory.schemas import InventoryMetaData
-from interview.inventory.serializers import InventoryLanguageSerializer, InventorySerializer, InventoryTagSerializer, InventoryTypeSerializer
+from interview.inventory.search import SEARCH_ORDERING
+from interview.inventory.serializers import InventoryBulkItemSerializer, InventoryFilterSerializer, InventoryLanguageSerializer, InventorySearchSerializer, InventorySerializer, InventoryTagSerializer, InventoryTypeSerializer
 
 
-class InventoryListCreateView(APIView):
-    queryset = Inventory.objects.all()
+class InventoryListCreateView(ConditionalGetMixin, FieldsetMixin, APIView):
+    queryset = Inventory.objects.with_related()
     serializer_class = InventorySerializer
+    fast_path = FastPathSerializer(InventorySerializer)
+    pagination_class = KeysetPagination
+    validator_models = (InventoryType, InventoryLanguage, InventoryTag)
     
     def post(self, request: Request, *args, **kwargs) -> Response:
-        try:
-            metadata = InventoryMetaData(**request.data['metadata'])
-        except Exception as e:
-            return Response({'error': str(e)}, status=400)
-        
-        request.data['metadata'] = metadata.dict()
         serializer = self.serializer_class(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=400)
@@ -27,23 +40,270 @@ class InventoryListCreateView(APIView):
         return Response(serializer.data, status=201)
     
     def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
+        filters = InventoryFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=400)
         
-        return Response(serializer.data, status=200)
+        queryset = self.get_queryset().filter_metadata(**filters.validated_data)
+        
+        return self.get_page_response(request, queryset, self.get_fieldset(request))
     
     def get_queryset(self):
         return self.queryset.all()
     
 
-class InventoryRetrieveUpdateDestroyView(APIView):
+class InventorySearchView(ConditionalGetMixin, FieldsetMixin, APIView):
+    """
+    Inventory items matching `q`, best first, each with its `rank`. Only the
+    `max_candidates` most relevant matches are ranked, which keeps typeahead
+    on short prefixes fast.
+    """
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
+    fast_path = FastPathSerializer(InventorySerializer)
+    pagination_class = OffsetPagination
+    max_candidates = 1000
+    validator_models = (InventoryType, InventoryLanguage, InventoryTag)
     
     def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs['id'])
-        serializer = self.serializer_class(inventory)
+        filters = InventorySearchSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=400)
         
-        return Response(serializer.data, status=200)
+        queryset = self.get_queryset().search(**filters.validated_data, candidates=self.max_candidates).order_by(*SEARCH_ORDERING)
+        
+        return self.get_page_response(request, queryset, self.get_fieldset(request), extra=('rank',))
+    
+    def get_queryset(self):
+        return self.queryset.all()
+
+
+class InventoryBulkCreateView(APIView):
+    """
+    Creates, or with `?upsert=true` creates and updates by name, up to
+    `max_items` inventory items in one transaction. Upserts lock the names
+    they touch until commit, so concurrent upserts of the same new name
+    cannot both insert it.
+    """
+    serializer_class = InventoryBulkItemSerializer
+    metadata_field = SchemaField(InventoryMetaData)
+    parser_classes = [FastJSONParser, NDJSONParser]
+    batch_size = 1000
+    max_items = 10000
+    
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        if not isinstance(request.data, list):
+            return Response({'error': 'Expected a list of inventory items'}, status=400)
+        if len(request.data) > self.max_items:
+            return Response({'error': f'Send at most {self.max_items} inventory items per request'}, status=400)
+        
+        upsert = request.query_params.get('upsert', '').lower() in ('1', 'true', 'yes')
+        items, errors = self.validate_items(request.data)
+        
+        types = self.resolve_names(InventoryType, {item['type'] for item in items.values()})
+        languages = self.resolve_names(InventoryLanguage, {item['language'] for item in items.values()})
+        tags = self.resolve_names(InventoryTag, {tag for item in items.values() for tag in item['tags']})
+        
+        with transaction.atomic():
+            existing = {}
+            if upsert:
+                names = {item['name'] for item in items.values()}
+                self.lock_names(names)
+                existing = self.get_existing(names)
+            
+            to_create = []
+            to_update = []
+            seen_names = set()
+            for index, item in items.items():
+                item_errors = self.get_reference_errors(item, types, languages, tags)
+                if upsert and item['name'] in seen_names:
+                    item_errors['name'] = ['Duplicate name in batch']
+                elif upsert and existing.get(item['name'], 0) is None:
+                    item_errors['name'] = ['Name matches more than one existing inventory item']
+                if item_errors:
+                    errors[index] = item_errors
+                    continue
+                
+                seen_names.add(item['name'])
+                inventory = Inventory(
+                    id=existing.get(item['name']),
+                    name=item['name'],
+                    type_id=types[item['type']],
+                    language_id=languages[item['language']],
+                    metadata=item['metadata'],
+                )
+                inventory.sync_metadata_columns()
+                if inventory.id is None:
+                    to_create.append((inventory, item['tags']))
+                else:
+                    inventory.updated_at = timezone.now()
+                    to_update.append((inventory, item['tags']))
+            
+            Inventory.objects.bulk_create([inventory for inventory, _ in to_create], batch_size=self.batch_size)
+            Inventory.objects.bulk_update(
+                [inventory for inventory, _ in to_update],
+                ['type', 'language', 'metadata', 'updated_at', 'search_vector', *Inventory.METADATA_COLUMNS],
+                batch_size=self.batch_size,
+            )
+            self.set_tags(to_create + to_update, tags, replace=bool(to_update))
+        
+        return Response({
+            'created': [inventory.id for inventory, _ in to_create],
+            'updated': [inventory.id for inventory, _ in to_update],
+            'errors': [{'index': index, 'errors': errors[index]} for index in sorted(errors)],
+        }, status=200)
+    
+    def validate_items(self, data: list) -> tuple[dict, dict]:
+        # One serializer validates every item, so its fields are not copied
+        # again for each of them, then the metadata of every item is
+        # validated in one batch.
+        serializer = self.serializer_class()
+        items = {}
+        errors = {}
+        for index, item in enumerate(data):
+            try:
+                items[index] = serializer.run_validation(item)
+            except ValidationError as e:
+                errors[index] = as_serializer_error(e)
+        
+        indexes = [
+            index for index, item in enumerate(data)
+            if isinstance(item, dict) and isinstance(item.get('metadata'), dict)
+        ]
+        validated, metadata_errors = self.metadata_field.validate_many([data[index]['metadata'] for index in indexes])
+        for position, index in enumerate(indexes):
+            if position in metadata_errors:
+                items.pop(index, None)
+                errors.setdefault(index, {})['metadata'] = metadata_errors[position]
+            elif index in items:
+                items[index]['metadata'] = validated[position]
+        
+        return items, errors
+    
+    def set_tags(self, rows, tags: dict, replace: bool):
+        through = Inventory.tags.through
+        if replace:
+            through.objects.filter(inventory_id__in=[inventory.id for inventory, _ in rows]).delete()
+        
+        through.objects.bulk_create(
+            [
+                through(inventory_id=inventory.id, inventorytag_id=tags[name])
+                for inventory, tag_names in rows
+                for name in dict.fromkeys(tag_names)
+            ],
+            batch_size=self.batch_size,
+        )
+    
+    @staticmethod
+    def resolve_names(model, names: set) -> dict:
+        return {name: instance.id for name, instance in model.get_many_by_name(names).items()}
+    
+    @staticmethod
+    def lock_names(names: set):
+        """
+        Takes a transaction-level advisory lock per name, in key order so two
+        batches cannot deadlock. `name` is not unique, so there is no row to
+        lock for a name that does not exist yet.
+        """
+        keys = sorted({zlib.crc32(f'{Inventory._meta.db_table}:{name}'.encode('utf-8')) for name in names})
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(key) FROM unnest(%s::bigint[]) AS key', [keys])
+    
+    @staticmethod
+    def get_existing(names: set) -> dict:
+        existing = {}
+        for name, id in Inventory.objects.filter(name__in=names).values_list('name', 'id'):
+            existing[name] = None if name in existing else id
+        
+        return existing
+    
+    @staticmethod
+    def get_reference_errors(item: dict, types: dict, languages: dict, tags: dict) -> dict:
+        errors = {}
+        if item['type'] not in types:
+            errors['type'] = [f'Unknown inventory type: {item["type"]}']
+        if item['language'] not in languages:
+            errors['language'] = [f'Unknown inventory language: {item["language"]}']
+        unknown_tags = [name for name in item['tags'] if name not in tags]
+        if unknown_tags:
+            errors['tags'] = [f'Unknown inventory tag: {name}' for name in unknown_tags]
+        
+        return errors
+
+
+class InventoryExportView(APIView):
+    queryset = Inventory.objects.with_related()
+    serializer_class = InventorySerializer
+    chunk_size = 2000
+    content_types = {
+        'json': 'application/json',
+        'ndjson': 'application/x-ndjson',
+    }
+    
+    def get(self, request: Request, *args, **kwargs) -> Response | StreamingHttpResponse:
+        export_format = request.query_params.get('export_format', 'json')
+        if export_format not in self.content_types:
+            return Response({'error': f'Unsupported export format: {export_format}'}, status=400)
+        
+        stream = self.stream_ndjson() if export_format == 'ndjson' else self.stream_json()
+        
+        return StreamingHttpResponse(stream, content_type=self.content_types[export_format], status=200)
+    
+    def get_queryset(self):
+        return self.queryset.order_by('id')
+    
+    def iter_chunks(self):
+        """
+        Serializes `chunk_size` rows at a time, each chunk its own query
+        keyed on `id`, so memory stays bounded without a server-side cursor,
+        which `DB_POOLER=transaction` disables.
+        """
+        queryset = self.get_queryset()
+        last_id = None
+        while True:
+            chunk = queryset if last_id is None else queryset.filter(id__gt=last_id)
+            chunk = list(chunk[:self.chunk_size])
+            if not chunk:
+                return
+            
+            yield self.serializer_class(chunk, many=True).data
+            if len(chunk) < self.chunk_size:
+                return
+            last_id = chunk[-1].id
+    
+    def stream_json(self):
+        yield b'['
+        separator = b''
+        for rows in self.iter_chunks():
+            yield separator + b','.join(dumps(row) for row in rows)
+            separator = b','
+        yield b']'
+    
+    def stream_ndjson(self):
+        for rows in self.iter_chunks():
+            yield b''.join(dumps(row) + b'\n' for row in rows)
+
+
+class InventoryRetrieveUpdateDestroyView(ConditionalGetMixin, FieldsetMixin, APIView):
+    queryset = Inventory.objects.with_related()
+    serializer_class = InventorySerializer
+    validator_models = (InventoryType, InventoryLanguage, InventoryTag)
+    
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        fieldset = self.get_fieldset(request)
+        queryset = self.annotate_validators(self.queryset.filter(id=kwargs['id']))
+        not_modified = self.get_not_modified(request, queryset, detail=True)
+        if not_modified is not None:
+            return not_modified
+        
+        inventory = self.prune_queryset(queryset, fieldset, extra=self.validator_fields).first()
+        if inventory is None:
+            raise NotFound()
+        
+        serializer = self.get_fieldset_serializer(fieldset, inventory)
+        response = Response(serializer.data, status=200)
+        
+        return self.set_validators(response, request, [tuple(getattr(inventory, key) for key in self.validator_keys)], detail=True)
     
     def patch(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs['id'])
@@ -65,8 +325,8 @@ class InventoryRetrieveUpdateDestroyView(APIView):
         return self.queryset.get(**kwargs)
 
 
-class InventoryTagListCreateView(APIView):
-    queryset = InventoryTag.objects.all()
+class InventoryTagListCreateView(ActiveQuerysetMixin, APIView):
+    queryset = InventoryTag.all_objects.all()
     serializer_class = InventoryTagSerializer
     
     def post(self, request: Request, *args, **kwargs) -> Response:
@@ -78,17 +338,15 @@ class InventoryTagListCreateView(APIView):
         
         return Response(serializer.data, status=201)
     
+    @cached_response
     def get(self, request: Request, *args, **kwargs) -> Response:
         serializer = self.serializer_class(self.get_queryset(), many=True)
         
         return Response(serializer.data, status=200)
-    
-    def get_queryset(self):
-        return self.queryset.all()
 
 
 class InventoryTagRetrieveUpdateDestroyView(APIView):
-    queryset = InventoryTag.objects.all()
+    queryset = InventoryTag.all_objects.all()
     serializer_class = InventoryTagSerializer
     
     def get(self, request: Request, *args, **kwargs) -> Response:
@@ -117,6 +375,11 @@ class InventoryTagRetrieveUpdateDestroyView(APIView):
         return self.queryset.get(**kwargs)
 
 
+class InventoryTagSetActiveView(SetActiveView):
+    queryset = InventoryTag.all_objects.all()
+    serializer_class = NameSetActiveSerializer
+
+
 class InventoryLanguageListCreateView(APIView):
     queryset = InventoryLanguage.objects.all()
     serializer_class = InventoryLanguageSerializer
@@ -130,6 +393,7 @@ class InventoryLanguageListCreateView(APIView):
         
         return Response(serializer.data, status=201)
     
+    @cached_response
     def get(self, request: Request, *args, **kwargs) -> Response:
         serializer = self.serializer_class(self.get_queryset(), many=True)
         
@@ -182,6 +446,7 @@ class InventoryTypeListCreateView(APIView):
         
         return Response(serializer.data, status=201)
     
+    @cached_response
     def get(self, request: Request, *args, **kwargs) -> Response:
         serializer = self.serializer_class(self.get_queryset(), many=True)
         
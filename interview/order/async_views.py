@@ -0,0 +1,32 @@
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
+
+from interview.core.pagination import KeysetPagination
+from interview.core.views import ActiveQuerysetMixin, FieldsetMixin, ajson_response, exception_response, json_response
+from interview.order.models import Order
+from interview.order.serializers import OrderSerializer
+
+
+class OrderAsyncListView(ActiveQuerysetMixin, FieldsetMixin, View):
+    queryset = Order.all_objects.with_related()
+    serializer_class = OrderSerializer
+    pagination_class = KeysetPagination
+    
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        try:
+            fieldset = self.get_fieldset(request)
+        except ValidationError as e:
+            return json_response(e.detail, status=400)
+        
+        paginator = self.pagination_class()
+        queryset = self.prune_queryset(self.get_queryset(), fieldset, extra=paginator.ordering)
+        try:
+            page = await paginator.apaginate_queryset(queryset, Request(request), view=self)
+        except APIException as e:
+            return exception_response(e)
+        
+        return await ajson_response(
+            lambda: paginator.get_paginated_response(self.get_fieldset_serializer(fieldset, page, many=True).data).data,
+        )
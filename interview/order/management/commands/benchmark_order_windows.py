@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from interview.core.benchmarks import best_of, without_indexes
+from interview.order.models import Order, OrderTag
+
+
+class Command(BaseCommand):
+    help = 'Times the order window queries with and without their indexes and prints their query plans.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs per scenario.',
+        )
+        parser.add_argument(
+            '--date',
+            type=date.fromisoformat,
+            default=date.today(),
+            help='Day the scenarios are centred on (YYYY-MM-DD).',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The order window index is a PostgreSQL GiST index; run this against PostgreSQL.')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Order._meta.db_table}')
+
+        day = options['date']
+        tag = OrderTag.all_objects.order_by('id').values_list('name', flat=True).first()
+        scenarios = {
+            'in effect on a day': Order.all_objects.in_effect_on(day),
+            'overlapping a week': Order.all_objects.in_window(day, day + timedelta(days=6)),
+            'covering a week': Order.all_objects.in_window(day, day + timedelta(days=6), contained=True),
+            'in effect on a day, active': Order.all_objects.in_effect_on(day).filter(is_active=True),
+            f'in effect on a day, tagged {tag}': Order.all_objects.in_effect_on(day).with_tags([tag]),
+            'in effect a year out': Order.all_objects.in_effect_on(day + timedelta(days=400)),
+        }
+
+        self.stdout.write(f'{Order.all_objects.count()} orders, scenarios around {day}')
+        for name, queryset in scenarios.items():
+            page = queryset.order_by('created_at', 'id').values_list('id', flat=True)[:101]
+            count = queryset.count()
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{name}: {count} orders'))
+            for label, query in (('count', queryset.count), ('first page', lambda: len(page.all()))):
+                indexed = best_of(options['repeat'], query)
+                with without_indexes():
+                    scanned = best_of(options['repeat'], query)
+                self.stdout.write(
+                    f'{label}: best {indexed * 1000:.1f} ms with indexes, '
+                    f'{scanned * 1000:.1f} ms without ({scanned / indexed:.1f}x)'
+                )
+            self.stdout.write(queryset.values('id').explain(analyze=True))
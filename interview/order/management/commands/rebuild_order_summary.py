@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from interview.order.summary import rebuild_order_summary
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per-tag, per-day order summary from the orders table.'
+
+    def handle(self, *args, **options):
+        rows = rebuild_order_summary()
+
+        self.stdout.write(f'Rebuilt the order summary with {rows} rows')
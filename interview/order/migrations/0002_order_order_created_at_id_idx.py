@@ -0,0 +1,22 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("order", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                fields=["created_at", "id"], name="order_created_at_id_idx"
+            ),
+        ),
+    ]
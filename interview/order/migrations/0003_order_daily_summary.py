@@ -0,0 +1,92 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:32
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+import django.db.models.deletion
+
+
+def populate_order_summary(apps, schema_editor):
+    """
+    Fills the summary from the existing orders, as rebuild_order_summary
+    does, using the historical models. An embargo before the start counts on
+    the start date.
+    """
+    alias = schema_editor.connection.alias
+    Order = apps.get_model("order", "Order")
+    OrderDailySummary = apps.get_model("order", "OrderDailySummary")
+    through = Order.tags.through
+
+    counts = defaultdict(lambda: [0, 0])
+    days = (
+        F("order__start_date"),
+        Greatest(F("order__start_date"), F("order__embargo_date")),
+    )
+    for position, column in enumerate(days):
+        grouped = (
+            through.objects.using(alias)
+            .values_list(column, "ordertag_id", "order__is_active")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        for day, tag_id, is_active, count in grouped:
+            counts[day, tag_id, is_active][position] = count
+
+    OrderDailySummary.objects.using(alias).bulk_create(
+        [
+            OrderDailySummary(
+                date=day,
+                tag_id=tag_id,
+                is_active=is_active,
+                starts=starts,
+                embargoes=embargoes,
+            )
+            for (day, tag_id, is_active), (starts, embargoes) in counts.items()
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0002_order_order_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderDailySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("is_active", models.BooleanField()),
+                ("starts", models.IntegerField(default=0)),
+                ("embargoes", models.IntegerField(default=0)),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="order.ordertag",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="orderdailysummary",
+            constraint=models.UniqueConstraint(
+                fields=("date", "tag", "is_active"), name="order_daily_summary_unique"
+            ),
+        ),
+        migrations.RunPython(populate_order_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:34
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("order", "0003_order_daily_summary"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.GistIndex(
+                models.Func(
+                    models.F("start_date"),
+                    django.db.models.functions.comparison.Greatest(
+                        models.F("start_date"), models.F("embargo_date")
+                    ),
+                    function="daterange",
+                    output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+                ),
+                name="order_window_gist_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:47
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("order", "0004_order_window_gist_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["created_at", "id"],
+                name="order_active_created_at_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:50
+
+from django.db import migrations
+import django.db.models.manager
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0005_order_active_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="order",
+            options={"default_manager_name": "all_objects"},
+        ),
+        migrations.AlterModelManagers(
+            name="order",
+            managers=[
+                ("all_objects", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="ordertag",
+            managers=[
+                ("all_objects", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
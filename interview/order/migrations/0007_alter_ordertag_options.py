@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 17:38
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0006_active_managers"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ordertag",
+            options={"default_manager_name": "all_objects", "ordering": ["id"]},
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.1.7 on 2026-10-18 17:40
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+
+def backfill_running_open(apps, schema_editor):
+    """
+    Recounts the summary from the orders, with an embargo before the start
+    counted on the start date, and sets the running `open` total of every
+    row. Summaries filled before that rule had embargoes on the embargo date.
+    """
+    alias = schema_editor.connection.alias
+    Order = apps.get_model("order", "Order")
+    OrderDailySummary = apps.get_model("order", "OrderDailySummary")
+    through = Order.tags.through
+
+    counts = defaultdict(lambda: [0, 0])
+    days = (
+        F("order__start_date"),
+        Greatest(F("order__start_date"), F("order__embargo_date")),
+    )
+    for position, column in enumerate(days):
+        grouped = (
+            through.objects.using(alias)
+            .values_list(column, "ordertag_id", "order__is_active")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        for day, tag_id, is_active, count in grouped:
+            counts[day, tag_id, is_active][position] = count
+
+    summaries = []
+    running = defaultdict(int)
+    for day, tag_id, is_active in sorted(counts, key=lambda key: (key[1], key[2], key[0])):
+        starts, embargoes = counts[day, tag_id, is_active]
+        running[tag_id, is_active] += starts - embargoes
+        summaries.append(
+            OrderDailySummary(
+                date=day,
+                tag_id=tag_id,
+                is_active=is_active,
+                starts=starts,
+                embargoes=embargoes,
+                open=running[tag_id, is_active],
+            )
+        )
+
+    OrderDailySummary.objects.using(alias).all().delete()
+    OrderDailySummary.objects.using(alias).bulk_create(summaries, batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0007_alter_ordertag_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderdailysummary",
+            name="open",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_running_open, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="orderdailysummary",
+            index=models.Index(
+                fields=["tag", "is_active", "date"], name="order_summary_running_idx"
+            ),
+        ),
+    ]
@@ -1,15 +1,68 @@
-from django.db import models
+from datetime import date
 
-from interview.core.behaviors import IsActiveModel, TimestampedModel, UniqueNameModel
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
+from django.db import models, router, transaction
+from django.db.models import Exists, F, Func, OuterRef, Q
+from django.db.models.functions import Greatest
+from psycopg2.extras import DateRange
+
+from interview.core.behaviors import ActiveManager, IsActiveModel, TimestampedModel, UniqueNameModel
 from interview.inventory.models import Inventory
 
 
 class OrderTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
-        
+    
+    class Meta(IsActiveModel.Meta):
+        # Nested tag lists render in a stable order on every code path.
+        ordering = ['id']
+    
     def __str__(self) -> str:
         return self.name
     
 
+def order_window():
+    """
+    The days an order is in effect, `[start_date, embargo_date)`, as the
+    expression `order_window_gist_idx` indexes. An embargo before the start
+    gives an empty range instead of an error.
+    """
+    return Func(
+        F('start_date'),
+        Greatest(F('start_date'), F('embargo_date')),
+        function='daterange',
+        output_field=DateRangeField(),
+    )
+
+
+class OrderQuerySet(models.QuerySet):
+
+    def with_related(self):
+        return self.select_related(
+            'inventory__type',
+            'inventory__language',
+        ).prefetch_related('tags', 'inventory__tags')
+
+    def in_effect_on(self, day: date):
+        return self.alias(window=order_window()).filter(window__contains=day)
+
+    def in_window(self, date_from: date, date_to: date, contained: bool = False):
+        """
+        Orders in effect on any day from `date_from` to `date_to` inclusive,
+        or with `contained`, on every one of those days.
+        """
+        days = DateRange(date_from, date_to, '[]')
+        if contained:
+            return self.alias(window=order_window()).filter(window__contains=days)
+
+        return self.alias(window=order_window()).filter(window__overlap=days)
+
+    def with_tags(self, names: list[str]):
+        through = Order.tags.through
+
+        return self.filter(Exists(through.objects.filter(order_id=OuterRef('pk'), ordertag__name__in=names)))
+
+
 class Order(TimestampedModel, IsActiveModel, models.Model):
     inventory = models.ForeignKey(
         Inventory,
@@ -19,6 +72,59 @@ class Order(TimestampedModel, IsActiveModel, models.Model):
     start_date = models.DateField()
     embargo_date = models.DateField()
     tags = models.ManyToManyField(OrderTag, related_name='orders')
+
+    all_objects = OrderQuerySet.as_manager()
+    objects = ActiveManager.from_queryset(OrderQuerySet)()
+
+    class Meta(IsActiveModel.Meta):
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='order_created_at_id_idx'),
+            models.Index(fields=['created_at', 'id'], condition=Q(is_active=True), name='order_active_created_at_id_idx'),
+            GistIndex(order_window(), name='order_window_gist_idx'),
+        ]
+    
+    def save(self, *args, **kwargs):
+        # The summary receivers lock and read the stored row in `pre_save`
+        # and move its counts in `post_save`; one transaction spans both, so
+        # concurrent saves of the same order apply their changes in turn.
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
+    
+    def __str__(self) -> str:
+        return f'{self.inventory.name} - {self.start_date}'
+
+
+class OrderDailySummary(models.Model):
+    """
+    Number of orders per tag, `is_active` flag and day: `starts` counts the
+    orders whose `start_date` is that day and `embargoes` those whose window
+    ends that day, on `embargo_date` or on `start_date` when the embargo is
+    earlier, as `order_window` has it. `open` is the running total of starts minus
+    embargoes for the tag and flag up to and including that day, so the
+    number of orders open before any date is read from a single row.
     
+    Kept current by the receivers in `interview.order.summary`;
+    `rebuild_order_summary` recomputes it after writes that bypass signals,
+    such as `bulk_create` or `update()`.
+    """
+    tag = models.ForeignKey(
+        OrderTag,
+        on_delete=models.CASCADE,
+        related_name='daily_summaries'
+    )
+    date = models.DateField()
+    is_active = models.BooleanField()
+    starts = models.IntegerField(default=0)
+    embargoes = models.IntegerField(default=0)
+    open = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'tag', 'is_active'], name='order_daily_summary_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['tag', 'is_active', 'date'], name='order_summary_running_idx'),
+        ]
+
     def __str__(self) -> str:
-        return f'{self.inventory.name} - {self.start_date}'
\ No newline at end of file
+        return f'{self.tag.name} - {self.date}'
@@ -1,20 +1,70 @@
 from rest_framework import serializers
+from interview.core.serializers import ProfiledModelSerializer, SetActiveSerializer
 from interview.inventory.serializers import InventorySerializer
 
 from interview.order.models import Order, OrderTag
 
 
-class OrderTagSerializer(serializers.ModelSerializer):
+class OrderTagSerializer(ProfiledModelSerializer):
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = OrderTag
         fields = ['id', 'name', 'is_active']
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(ProfiledModelSerializer):
     inventory = InventorySerializer()
     tags = OrderTagSerializer(many=True)
     
-    class Meta:
+    class Meta(ProfiledModelSerializer.Meta):
         model = Order
-        fields = ['id', 'inventory', 'start_date', 'embargo_date', 'tags', 'is_active']
\ No newline at end of file
+        fields = ['id', 'inventory', 'start_date', 'embargo_date', 'tags', 'is_active']
+
+
+class OrderSummaryFilterSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    tag = serializers.ListField(child=serializers.CharField(), required=False, source='tags')
+    is_active = serializers.BooleanField(required=False, allow_null=True, default=None)
+    
+    def validate(self, data: dict) -> dict:
+        if data['date_from'] > data['date_to']:
+            raise serializers.ValidationError({'date_to': ['Must not be before date_from']})
+        
+        return data
+
+
+class OrderWindowFilterSerializer(serializers.Serializer):
+    date = serializers.DateField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    match = serializers.ChoiceField(choices=['overlap', 'contains'], default='overlap')
+    tag = serializers.ListField(child=serializers.CharField(), required=False, source='tags')
+    is_active = serializers.BooleanField(required=False, allow_null=True, default=None)
+    
+    def validate(self, data: dict) -> dict:
+        if 'date' in data:
+            if 'date_from' in data or 'date_to' in data:
+                raise serializers.ValidationError('Give either date or date_from and date_to, not both')
+        elif 'date_from' not in data or 'date_to' not in data:
+            raise serializers.ValidationError('Give either date or date_from and date_to')
+        elif data['date_from'] > data['date_to']:
+            raise serializers.ValidationError({'date_to': ['Must not be before date_from']})
+        
+        return data
+
+
+class OrderSetActiveSerializer(SetActiveSerializer):
+    inventory = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, required=False)
+    tag = serializers.ListField(child=serializers.CharField(), allow_empty=False, required=False, source='tags')
+    embargo_before = serializers.DateField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    
+    def validate(self, data: dict) -> dict:
+        if ('date_from' in data) != ('date_to' in data):
+            raise serializers.ValidationError('Give both date_from and date_to')
+        if 'date_from' in data and data['date_from'] > data['date_to']:
+            raise serializers.ValidationError({'date_to': ['Must not be before date_from']})
+        
+        return super().validate(data)
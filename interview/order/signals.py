@@ -0,0 +1,13 @@
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+
+from interview.core.behaviors import pre_set_active, touch_m2m_owners
+from interview.order.models import Order
+from interview.order.summary import capture_order_state, move_orders, remove_deleted_order, update_order_summary, update_tag_summary
+
+
+pre_save.connect(capture_order_state, sender=Order, dispatch_uid='order-summary-pre-save')
+post_save.connect(update_order_summary, sender=Order, dispatch_uid='order-summary-save')
+pre_delete.connect(remove_deleted_order, sender=Order, dispatch_uid='order-summary-delete')
+m2m_changed.connect(update_tag_summary, sender=Order.tags.through, dispatch_uid='order-summary-tags')
+m2m_changed.connect(touch_m2m_owners, sender=Order.tags.through, dispatch_uid='touch-order-tags')
+pre_set_active.connect(move_orders, sender=Order, dispatch_uid='order-summary-set-active')
@@ -0,0 +1,263 @@
+import zlib
+from collections import defaultdict
+from datetime import date
+
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Greatest
+
+from interview.order.models import Order, OrderDailySummary, OrderTag
+
+PENDING_KEY = '_order_summary_pending'
+PREVIOUS_KEY = '_order_summary_previous'
+SUMMARY_FIELDS = ('start_date', 'embargo_date', 'is_active')
+BATCH_SIZE = 1000
+
+# The days a tagged order counts as a start and as an embargo, grouped on
+# the through table. An embargo before the start counts on the start date,
+# as `order_window` has it, so the order is never open.
+SUMMARY_DAYS = (
+    F('order__start_date'),
+    Greatest(F('order__start_date'), F('order__embargo_date')),
+)
+
+# Sets `open` on the rows of one tag and flag from `date` on: the total of
+# the last row before `date` plus the starts minus embargoes since.
+RUNNING_OPEN_SQL = """
+UPDATE {table} AS summary SET open = running.open
+FROM (
+    SELECT id, COALESCE((
+        SELECT open FROM {table}
+        WHERE tag_id = %(tag_id)s AND is_active = %(is_active)s AND date < %(date)s
+        ORDER BY date DESC LIMIT 1
+    ), 0) + SUM(starts - embargoes) OVER (ORDER BY date) AS open
+    FROM {table}
+    WHERE tag_id = %(tag_id)s AND is_active = %(is_active)s AND date >= %(date)s
+) AS running
+WHERE summary.id = running.id AND summary.open <> running.open
+"""
+
+
+def get_tagged_orders(**filters) -> list:
+    """
+    Returns `(tag id, start_date, embargo_date, is_active)` for every row of
+    the order/tag through table matching `filters`.
+    """
+    through = Order.tags.through
+
+    return list(through.objects.filter(**filters).values_list(
+        'ordertag_id', 'order__start_date', 'order__embargo_date', 'order__is_active',
+    ))
+
+
+def add_deltas(deltas: dict, rows, sign: int):
+    for tag_id, start_date, embargo_date, is_active in rows:
+        deltas[start_date, tag_id, is_active][0] += sign
+        deltas[max(start_date, embargo_date), tag_id, is_active][1] += sign
+
+
+def apply_deltas(deltas: dict):
+    """
+    Adds `{(date, tag id, is_active): [starts, embargoes]}` to the summary
+    with batched upserts, so concurrent writers increment rather than
+    overwrite each other, then recomputes the running `open` totals from the
+    earliest day changed for each tag and flag. Writers to the same tag and
+    flag take turns on an advisory lock, so no total misses a change.
+    """
+    rows = [(*key, *counts) for key, counts in deltas.items() if any(counts)]
+    if not rows:
+        return
+
+    earliest = {}
+    for day, tag_id, is_active, _, _ in rows:
+        if earliest.get((tag_id, is_active), day) >= day:
+            earliest[tag_id, is_active] = day
+
+    db_table = OrderDailySummary._meta.db_table
+    table = connection.ops.quote_name(db_table)
+    keys = sorted({zlib.crc32(f'{db_table}:{tag_id}:{is_active}'.encode('utf-8')) for tag_id, is_active in earliest})
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(key) FROM unnest(%s::bigint[]) AS key', [keys])
+
+        for offset in range(0, len(rows), BATCH_SIZE):
+            batch = rows[offset:offset + BATCH_SIZE]
+            placeholders = ', '.join(['(%s, %s, %s, %s, %s, 0)'] * len(batch))
+            cursor.execute(
+                f'INSERT INTO {table} (date, tag_id, is_active, starts, embargoes, open) VALUES {placeholders} '
+                f'ON CONFLICT (date, tag_id, is_active) DO UPDATE SET '
+                f'starts = {table}.starts + EXCLUDED.starts, embargoes = {table}.embargoes + EXCLUDED.embargoes',
+                [value for row in batch for value in row],
+            )
+
+        for (tag_id, is_active), day in earliest.items():
+            cursor.execute(RUNNING_OPEN_SQL.format(table=table), {'tag_id': tag_id, 'is_active': is_active, 'date': day})
+
+
+def capture_order_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    `pre_save` receiver that remembers the stored dates and flag of an
+    existing order, so `post_save` can move its counts if they change. The
+    row stays locked until `Order.save` commits, so a concurrent save of the
+    same order reads the values this one writes.
+    """
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not set(update_fields) & set(SUMMARY_FIELDS):
+        return
+
+    previous = sender._default_manager.select_for_update().filter(pk=instance.pk).values_list(*SUMMARY_FIELDS).first()
+    setattr(instance, PREVIOUS_KEY, previous)
+
+
+def update_order_summary(sender, instance, raw=False, **kwargs):
+    previous = instance.__dict__.pop(PREVIOUS_KEY, None)
+    if raw or previous is None:
+        return
+
+    current = sender._default_manager.filter(pk=instance.pk).values_list(*SUMMARY_FIELDS).get()
+    if current == previous:
+        return
+
+    tag_ids = list(sender.tags.through.objects.filter(order_id=instance.pk).values_list('ordertag_id', flat=True))
+    deltas = defaultdict(lambda: [0, 0])
+    add_deltas(deltas, [(tag_id, *previous) for tag_id in tag_ids], -1)
+    add_deltas(deltas, [(tag_id, *current) for tag_id in tag_ids], 1)
+    apply_deltas(deltas)
+
+
+def remove_deleted_order(sender, instance, **kwargs):
+    """
+    `pre_delete` receiver: the tag rows are deleted with the order without
+    an `m2m_changed` signal, so its counts are removed beforehand, inside the
+    same transaction as the delete.
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    add_deltas(deltas, get_tagged_orders(order_id=instance.pk), -1)
+    apply_deltas(deltas)
+
+
+def update_tag_summary(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    """
+    `m2m_changed` receiver for `Order.tags`, from either side of the relation.
+    Removals are looked up before they happen, since `pk_set` may name tags
+    the order never had.
+    """
+    if reverse:
+        filters = {'ordertag_id': instance.pk}
+        if pk_set is not None:
+            filters['order_id__in'] = pk_set
+    else:
+        filters = {'order_id': instance.pk}
+        if pk_set is not None:
+            filters['ordertag_id__in'] = pk_set
+
+    if action in ('pre_remove', 'pre_clear'):
+        setattr(instance, PENDING_KEY, get_tagged_orders(**filters))
+        return
+
+    deltas = defaultdict(lambda: [0, 0])
+    if action == 'post_add':
+        add_deltas(deltas, get_tagged_orders(**filters), 1)
+    elif action in ('post_remove', 'post_clear'):
+        add_deltas(deltas, instance.__dict__.pop(PENDING_KEY, []), -1)
+    apply_deltas(deltas)
+
+
+def move_orders(sender, queryset, is_active: bool, **kwargs):
+    """
+    `pre_set_active` receiver: moves the counts of the orders in `queryset`,
+    which all have the opposite flag, over to `is_active` with two grouped
+    queries rather than one per order.
+    """
+    through = Order.tags.through
+    deltas = defaultdict(lambda: [0, 0])
+    for position, column in enumerate(SUMMARY_DAYS):
+        grouped = (
+            through.objects.filter(order__in=queryset.values('pk'))
+            .values_list(column, 'ordertag_id')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for day, tag_id, count in grouped:
+            deltas[day, tag_id, not is_active][position] -= count
+            deltas[day, tag_id, is_active][position] += count
+    apply_deltas(deltas)
+
+
+def rebuild_order_summary() -> int:
+    """
+    Recomputes the whole summary from `Order` and returns the number of rows
+    written.
+    """
+    through = Order.tags.through
+    counts = defaultdict(lambda: [0, 0])
+    for position, column in enumerate(SUMMARY_DAYS):
+        grouped = through.objects.values_list(column, 'ordertag_id', 'order__is_active').annotate(count=Count('id'))
+        for day, tag_id, is_active, count in grouped.order_by():
+            counts[day, tag_id, is_active][position] = count
+
+    summaries = []
+    running = defaultdict(int)
+    for day, tag_id, is_active in sorted(counts, key=lambda key: (key[1], key[2], key[0])):
+        starts, embargoes = counts[day, tag_id, is_active]
+        running[tag_id, is_active] += starts - embargoes
+        summaries.append(OrderDailySummary(
+            date=day, tag_id=tag_id, is_active=is_active, starts=starts, embargoes=embargoes,
+            open=running[tag_id, is_active],
+        ))
+
+    with transaction.atomic():
+        OrderDailySummary.objects.all().delete()
+        OrderDailySummary.objects.bulk_create(summaries, batch_size=5000)
+
+    return len(counts)
+
+
+def get_order_summary(date_from: date, date_to: date, tags: list[str] = None, is_active: bool = None) -> list[dict]:
+    """
+    Per-tag counts between `date_from` and `date_to`. `open` is the number of
+    orders in effect, as `Order.objects.in_effect_on` counts them, first on
+    the day before `date_from` and then on each day with any starts or
+    embargoes. Only summary rows are read: the running total of the last row
+    before `date_from` for each tag and flag, then the rows in the range, so
+    the cost depends on tags and days in the range rather than on orders or
+    on how far back the summary goes.
+    """
+    queryset = OrderDailySummary.objects.filter(date__gte=date_from, date__lte=date_to)
+    tag_queryset = OrderTag.all_objects.all()
+    if tags:
+        queryset = queryset.filter(tag__name__in=tags)
+        tag_queryset = tag_queryset.filter(name__in=tags)
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active)
+
+    flags = (True, False) if is_active is None else (is_active,)
+    before = tag_queryset.order_by().values_list('name', *(
+        Subquery(
+            OrderDailySummary.objects.filter(tag=OuterRef('pk'), is_active=flag, date__lt=date_from)
+            .order_by('-date').values('open')[:1]
+        )
+        for flag in flags
+    ))
+
+    results = {}
+    for tag_name, *totals in before:
+        if any(total is not None for total in totals):
+            results[tag_name] = {'tag': tag_name, 'open': sum(total or 0 for total in totals), 'days': []}
+
+    days = (
+        queryset.values_list('tag__name', 'date')
+        .annotate(Sum('starts'), Sum('embargoes'))
+        .order_by('date')
+    )
+    for tag_name, day, starts, embargoes in days:
+        summary = results.setdefault(tag_name, {'tag': tag_name, 'open': 0, 'days': []})
+        previous = summary['days'][-1]['open'] if summary['days'] else summary['open']
+        summary['days'].append({
+            'date': day.isoformat(),
+            'starts': starts,
+            'embargoes': embargoes,
+            'open': previous + starts - embargoes,
+        })
+
+    return [results[tag_name] for tag_name in sorted(results)]
@@ -1,9 +1,15 @@
 
 from django.urls import path
-from interview.order.views import OrderListCreateView, OrderTagListCreateView
+from interview.order.async_views import OrderAsyncListView
+from interview.order.views import OrderListCreateView, OrderSetActiveView, OrderSummaryView, OrderTagListCreateView, OrderTagSetActiveView, OrderWindowView
 
 
 urlpatterns = [
+    path('async/', OrderAsyncListView.as_view(), name='order-async-list'),
+    path('summary/', OrderSummaryView.as_view(), name='order-summary'),
+    path('window/', OrderWindowView.as_view(), name='order-window'),
+    path('active/', OrderSetActiveView.as_view(), name='order-set-active'),
+    path('tags/active/', OrderTagSetActiveView.as_view(), name='order-tags-set-active'),
     path('tags/', OrderTagListCreateView.as_view(), name='order-detail'),
     path('', OrderListCreateView.as_view(), name='order-list'),
 
@@ -1,15 +1,109 @@
 from django.shortcuts import render
 from rest_framework import generics
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from interview.core.cache import cached_response
+from interview.core.fastpath import FastPathSerializer
+from interview.core.pagination import KeysetPagination
+from interview.core.profiling import span
+from interview.core.serializers import NameSetActiveSerializer
+from interview.core.views import ActiveQuerysetMixin, ConditionalGetMixin, FieldsetMixin, SetActiveView
+from interview.inventory.models import InventoryLanguage, InventoryTag, InventoryType
 from interview.order.models import Order, OrderTag
-from interview.order.serializers import OrderSerializer, OrderTagSerializer
+from interview.order.serializers import OrderSerializer, OrderSetActiveSerializer, OrderSummaryFilterSerializer, OrderTagSerializer, OrderWindowFilterSerializer
+from interview.order.summary import get_order_summary
 
 # Create your views here.
-class OrderListCreateView(generics.ListCreateAPIView):
-    queryset = Order.objects.all()
+class OrderListCreateView(ActiveQuerysetMixin, ConditionalGetMixin, FieldsetMixin, generics.ListCreateAPIView):
+    queryset = Order.all_objects.with_related()
     serializer_class = OrderSerializer
+    fast_path = FastPathSerializer(OrderSerializer)
+    pagination_class = KeysetPagination
+    validator_fields = ('updated_at', 'inventory__updated_at')
+    validator_models = (InventoryType, InventoryLanguage, InventoryTag, OrderTag)
+    
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self.get_page_response(request, self.filter_queryset(self.get_queryset()), self.get_fieldset(request))
     
 
-class OrderTagListCreateView(generics.ListCreateAPIView):
-    queryset = OrderTag.objects.all()
+class OrderTagListCreateView(ActiveQuerysetMixin, generics.ListCreateAPIView):
+    queryset = OrderTag.all_objects.all()
     serializer_class = OrderTagSerializer
+    
+    @cached_response
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return super().get(request, *args, **kwargs)
+
+
+class OrderSummaryView(APIView):
+    
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        filters = OrderSummaryFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=400)
+        
+        # The summary is built from plain rows rather than a serializer; time
+        # it as one, less its two queries.
+        with span('serialize'):
+            results = get_order_summary(**filters.validated_data)
+        
+        return Response({'results': results}, status=200)
+
+
+class OrderWindowView(ActiveQuerysetMixin, ConditionalGetMixin, FieldsetMixin, APIView):
+    queryset = Order.all_objects.with_related()
+    serializer_class = OrderSerializer
+    fast_path = FastPathSerializer(OrderSerializer)
+    pagination_class = KeysetPagination
+    validator_fields = ('updated_at', 'inventory__updated_at')
+    validator_models = (InventoryType, InventoryLanguage, InventoryTag, OrderTag)
+    
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        filters = OrderWindowFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=400)
+        
+        queryset = self.filter_queryset(self.get_queryset(), **filters.validated_data)
+        
+        return self.get_page_response(request, queryset, self.get_fieldset(request))
+    
+    def get_queryset(self):
+        return self.queryset.all()
+    
+    def filter_queryset(self, queryset, match: str, is_active: bool = None, tags: list[str] = None, **dates):
+        if 'date' in dates:
+            queryset = queryset.in_effect_on(dates['date'])
+        else:
+            queryset = queryset.in_window(dates['date_from'], dates['date_to'], contained=match == 'contains')
+        if is_active is None and not self.include_inactive(self.request):
+            is_active = True
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+        if tags:
+            queryset = queryset.with_tags(tags)
+        
+        return queryset
+
+
+class OrderSetActiveView(SetActiveView):
+    queryset = Order.all_objects.all()
+    serializer_class = OrderSetActiveSerializer
+    
+    def filter_queryset(self, queryset, inventory: list[int] = None, tags: list[str] = None, embargo_before=None, date_from=None, date_to=None):
+        if inventory:
+            queryset = queryset.filter(inventory_id__in=inventory)
+        if tags:
+            queryset = queryset.with_tags(tags)
+        if embargo_before is not None:
+            queryset = queryset.filter(embargo_date__lt=embargo_before)
+        if date_from is not None:
+            queryset = queryset.in_window(date_from, date_to)
+        
+        return queryset
+
+
+class OrderTagSetActiveView(SetActiveView):
+    queryset = OrderTag.all_objects.all()
+    serializer_class = NameSetActiveSerializer
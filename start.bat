@@ -13,4 +13,4 @@ echo Migrating...
 python manage.py migrate --settings=config.settings.local
 
 echo Adding data to database...
-echo from database import * | python manage.py shell
\ No newline at end of file
+python manage.py seed_data --settings=config.settings.local
\ No newline at end of file
@@ -0,0 +1,59 @@
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.cache import caches
+from django.core.management import call_command
+
+from interview.core.behaviors import UniqueNameModel, get_name_cache
+from interview.order.models import OrderDailySummary
+
+# Rows seeded for the smaller of the two sizes query-count tests compare.
+SCALE = 20
+
+
+def make_item(name: str, year: int = 2000) -> dict:
+    """
+    An inventory item payload for the bulk and create endpoints, using
+    lookups the fixture catalog seeds.
+    """
+    return {
+        'name': name,
+        'type': 'Movie',
+        'language': 'English',
+        'tags': ['Action'],
+        'metadata': {'year': year, 'actors': ['Keanu Reeves'], 'imdb_rating': 7.5, 'rotten_tomatoes_rating': 80},
+    }
+
+
+def get_rows() -> set:
+    """
+    The non-empty order summary rows, to compare against a rebuild.
+    """
+    return set(
+        OrderDailySummary.objects.exclude(starts=0, embargoes=0)
+        .values_list('date', 'tag_id', 'is_active', 'starts', 'embargoes', 'open')
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+    for model in apps.get_models():
+        if issubclass(model, UniqueNameModel):
+            get_name_cache(model).clear()
+            get_name_cache(model).expire()
+
+
+@pytest.fixture
+def seed(db):
+    """
+    Seeds the fixture catalog plus `scale` synthetic inventory items, each
+    with one order. Calls add up, so `seed(N)` then `seed(9 * N, seed=1)`
+    gives 10N synthetic rows.
+    """
+    def seed(scale: int = 0, seed: int = 0):
+        call_command('seed_data', scale=scale, seed=seed, stdout=StringIO())
+
+    return seed
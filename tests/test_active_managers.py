@@ -0,0 +1,51 @@
+import pytest
+
+from interview.inventory.models import InventoryTag
+from interview.order.models import Order, OrderTag
+
+TAG_LISTS = [
+    ('/inventory/tags/', InventoryTag),
+    ('/orders/tags/', OrderTag),
+]
+
+
+def get_names(response) -> set:
+    return {tag['name'] for tag in response.json()}
+
+
+@pytest.mark.parametrize('model', [InventoryTag, OrderTag, Order])
+def test_objects_hides_inactive_rows(seed, model):
+    seed()
+    inactive = model.objects.order_by('id').first()
+    active_count = model.objects.count()
+    model.deactivate(inactive.pk)
+
+    assert not model.objects.filter(pk=inactive.pk).exists()
+    assert model.all_objects.filter(pk=inactive.pk).exists()
+    assert model.objects.count() == active_count - 1
+
+
+@pytest.mark.parametrize('url, model', TAG_LISTS)
+def test_tag_lists_hide_inactive_tags(client, seed, url, model):
+    seed()
+    inactive = model.all_objects.order_by('id').first()
+    model.deactivate(inactive.pk)
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert get_names(response) == set(model.objects.values_list('name', flat=True))
+    assert inactive.name not in get_names(response)
+
+
+@pytest.mark.parametrize('url, model', TAG_LISTS)
+def test_include_inactive_lists_every_tag(client, seed, url, model):
+    seed()
+    inactive = model.all_objects.order_by('id').first()
+    model.deactivate(inactive.pk)
+
+    response = client.get(url, {'include_inactive': 'true'})
+
+    assert response.status_code == 200
+    assert get_names(response) == set(model.all_objects.values_list('name', flat=True))
+    assert {tag['is_active'] for tag in response.json() if tag['name'] == inactive.name} == {False}
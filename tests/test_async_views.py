@@ -0,0 +1,74 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from interview.inventory.models import Inventory
+from tests.conftest import SCALE
+
+LISTS = [
+    ('/inventory/', '/inventory/async/', {}),
+    ('/inventory/', '/inventory/async/', {'year_min': 2000, 'actor': 'Keanu Reeves'}),
+    ('/inventory/', '/inventory/async/', {'fields': 'id,name,type', 'expand': 'type'}),
+    ('/orders/', '/orders/async/', {}),
+    ('/orders/', '/orders/async/', {'include_inactive': 'true'}),
+    ('/orders/', '/orders/async/', {'fields': 'id,start_date,inventory'}),
+]
+
+
+def get_cursor(link: str | None) -> list | None:
+    return parse_qs(urlsplit(link).query).get('cursor') if link else None
+
+
+def get_async(async_client, url: str, params: dict):
+    async def get():
+        return await async_client.get(url, params, HTTP_ACCEPT='application/json')
+
+    return async_to_sync(get)()
+
+
+def get_pages(client, async_client, sync_url: str, async_url: str, params: dict):
+    response = client.get(sync_url, params, HTTP_ACCEPT='application/json')
+    async_response = get_async(async_client, async_url, params)
+
+    assert response.status_code == async_response.status_code == 200
+
+    return response.json(), async_response.json()
+
+
+@pytest.mark.parametrize('sync_url, async_url, params', LISTS)
+def test_async_lists_match_the_sync_views(client, async_client, seed, sync_url, async_url, params):
+    seed(SCALE)
+    params = {**params, 'page_size': 7}
+
+    page, async_page = get_pages(client, async_client, sync_url, async_url, params)
+    cursor = get_cursor(page['next'])
+
+    assert async_page['results'] == page['results']
+    assert get_cursor(async_page['next']) == cursor
+
+    if cursor is not None:
+        next_page, async_next_page = get_pages(client, async_client, sync_url, async_url, {**params, 'cursor': cursor})
+
+        assert async_next_page['results'] == next_page['results']
+
+
+@pytest.mark.parametrize('params', [{}, {'fields': 'id,name,metadata'}])
+def test_async_detail_matches_the_sync_view(client, async_client, seed, params):
+    seed()
+    inventory = Inventory.objects.order_by('-id').first()
+
+    response = client.get(f'/inventory/{inventory.id}/', params, HTTP_ACCEPT='application/json')
+    async_response = get_async(async_client, f'/inventory/async/{inventory.id}/', params)
+
+    assert async_response.status_code == 200
+    assert async_response.json() == response.json()
+
+
+@pytest.mark.parametrize('url', ['/inventory/async/', '/orders/async/'])
+def test_async_lists_reject_unknown_fields(async_client, seed, url):
+    seed()
+
+    response = get_async(async_client, url, {'fields': 'nope'})
+
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+import pytest
+
+from interview.inventory.models import Inventory, InventoryTag
+
+
+@pytest.fixture
+def inventory(seed):
+    seed()
+
+    return Inventory.objects.filter(tags__isnull=False).order_by('id').first()
+
+
+def get_etag(client, path: str) -> str:
+    response = client.get(path, HTTP_ACCEPT='application/json')
+    assert response.status_code == 200
+
+    return response['ETag']
+
+
+@pytest.mark.parametrize('path', ['/inventory/', '/inventory/{id}/', '/orders/'])
+def test_unchanged_response_is_not_modified(client, inventory, path):
+    path = path.format(id=inventory.id)
+    etag = get_etag(client, path)
+
+    response = client.get(path, HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+
+@pytest.mark.parametrize('path', ['/inventory/', '/inventory/{id}/', '/orders/'])
+def test_etag_follows_lookup_rename(client, inventory, path):
+    path = path.format(id=inventory.id)
+    etag = get_etag(client, path)
+
+    tag = inventory.tags.first()
+    tag.name = 'Renamed'
+    tag.save()
+
+    assert get_etag(client, path) != etag
+
+
+def test_etag_follows_lookup_delete(client, inventory):
+    path = f'/inventory/{inventory.id}/'
+    etag = get_etag(client, path)
+
+    # Not the latest tag, so only the count of tags moves.
+    InventoryTag.all_objects.exclude(inventories=inventory).order_by('updated_at').first().delete()
+
+    assert get_etag(client, path) != etag
+
+
+@pytest.mark.parametrize('headers', [{}, {'HTTP_IF_NONE_MATCH': '*'}])
+def test_missing_detail_is_not_found(client, inventory, headers):
+    response = client.get('/inventory/999999/', HTTP_ACCEPT='application/json', **headers)
+
+    assert response.status_code == 404
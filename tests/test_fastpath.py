@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from interview.core.fastpath import FastPathSerializer
+from interview.core.fieldsets import Fieldset
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import InventorySerializer
+from interview.order.models import Order
+from interview.order.serializers import OrderSerializer
+from tests.conftest import SCALE, make_item
+
+renderer = JSONRenderer()
+
+
+class InventoryColumnsSerializer(serializers.ModelSerializer):
+    
+    class Meta:
+        model = Inventory
+        fields = ['id', 'year', 'imdb_rating', 'rotten_tomatoes_rating']
+
+
+@pytest.fixture
+def catalog(client, seed):
+    """
+    The seeded catalog plus an inventory item and an order without tags, and
+    an item whose ratings are too large for their columns, which are NULL.
+    """
+    seed(SCALE)
+    untagged = make_item('Untagged')
+    untagged['tags'] = []
+    unrated = make_item('Unrated')
+    unrated['metadata']['imdb_rating'] = 99.95
+    unrated['metadata']['rotten_tomatoes_rating'] = 1000
+    client.post('/inventory/bulk/', [untagged, unrated], content_type='application/json')
+    Order.objects.create(
+        inventory=Inventory.objects.get(name='Untagged'),
+        start_date=datetime.date(2024, 1, 1),
+        embargo_date=datetime.date(2024, 2, 1),
+    )
+
+
+def render_drf(serializer_class, queryset, fieldset=None) -> bytes:
+    serializer = serializer_class(queryset, many=True)
+    if fieldset is not None:
+        fieldset.apply(serializer)
+
+    return renderer.render(serializer.data)
+
+
+@pytest.mark.parametrize('serializer_class, model', [
+    (InventorySerializer, Inventory),
+    (OrderSerializer, Order),
+    (InventoryColumnsSerializer, Inventory),
+])
+def test_fast_path_renders_like_drf(catalog, serializer_class, model):
+    queryset = model._default_manager.order_by('id')
+
+    assert renderer.render(FastPathSerializer(serializer_class).serialize(queryset)) == render_drf(serializer_class, queryset)
+
+
+@pytest.mark.parametrize('serializer_class, model, fields, expand', [
+    (InventorySerializer, Inventory, 'id,name', None),
+    (InventorySerializer, Inventory, 'id,type,tags', None),
+    (InventorySerializer, Inventory, None, 'tags'),
+    (InventorySerializer, Inventory, 'name,type.name,tags.name', None),
+    (OrderSerializer, Order, 'id,inventory', None),
+    (OrderSerializer, Order, 'id,inventory.name,inventory.tags', 'tags'),
+    (OrderSerializer, Order, 'start_date,tags.name', 'inventory.language'),
+])
+def test_fast_path_renders_fieldsets_like_drf(catalog, serializer_class, model, fields, expand):
+    fieldset = Fieldset.from_query(serializer_class(), fields, expand)
+    queryset = model._default_manager.order_by('id')
+    fast_path = FastPathSerializer(serializer_class)
+
+    assert renderer.render(fast_path.serialize(queryset, fieldset=fieldset)) == render_drf(serializer_class, queryset, fieldset)
+    assert renderer.render(fast_path.serialize(fieldset.prune(queryset, serializer_class), fieldset=fieldset)) == render_drf(
+        serializer_class, fieldset.prune(queryset, serializer_class), fieldset,
+    )
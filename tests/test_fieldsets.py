@@ -0,0 +1,99 @@
+import pytest
+
+from interview.inventory.models import Inventory
+from tests.conftest import SCALE
+
+
+def get(client, url: str, params: dict):
+    return client.get(url, params, HTTP_ACCEPT='application/json')
+
+
+@pytest.mark.parametrize('url, params, keys', [
+    ('/inventory/', {'fields': 'id,name'}, {'id', 'name'}),
+    ('/inventory/', {'fields': 'id,metadata'}, {'id', 'metadata'}),
+    ('/orders/', {'fields': 'id,start_date'}, {'id', 'start_date'}),
+    ('/orders/window/', {'fields': 'id,embargo_date', 'date_from': '1900-01-01', 'date_to': '2100-01-01'}, {'id', 'embargo_date'}),
+])
+def test_lists_render_only_the_selected_fields(client, seed, url, params, keys):
+    seed(SCALE)
+
+    response = get(client, url, params)
+
+    assert response.status_code == 200
+    assert response.json()['results']
+    assert {tuple(sorted(item)) for item in response.json()['results']} <= {tuple(sorted(keys))}
+
+
+def test_unexpanded_relations_render_as_primary_keys(client, seed):
+    seed(SCALE)
+    inventory = Inventory.objects.order_by('-id').first()
+
+    response = get(client, f'/inventory/{inventory.id}/', {'fields': 'id,type,tags'})
+
+    assert response.json() == {
+        'id': inventory.id,
+        'type': inventory.type_id,
+        'tags': list(inventory.tags.order_by('id').values_list('id', flat=True)),
+    }
+
+
+def test_expanded_relations_render_their_selected_fields(client, seed):
+    seed(SCALE)
+    inventory = Inventory.objects.order_by('-id').first()
+
+    response = get(client, f'/inventory/{inventory.id}/', {'fields': 'id,type.name', 'expand': 'tags'})
+
+    assert response.json() == {
+        'id': inventory.id,
+        'type': {'name': inventory.type.name},
+        'tags': [
+            {'id': tag.id, 'name': tag.name, 'is_active': tag.is_active}
+            for tag in inventory.tags.order_by('id')
+        ],
+    }
+
+
+@pytest.mark.parametrize('url, params, queries', [
+    # The page alone: no tags to prefetch.
+    ('/inventory/', {'fields': 'id,name'}, 1),
+    # The page, then the tags of every item on it.
+    ('/inventory/', {'fields': 'id,tags'}, 2),
+    # The page with each order's inventory, no tags.
+    ('/orders/', {'fields': 'id,inventory.name'}, 1),
+    ('/orders/', {'fields': 'id,start_date'}, 1),
+])
+def test_lists_only_query_what_the_fields_need(client, seed, django_assert_num_queries, url, params, queries):
+    seed(SCALE)
+
+    with django_assert_num_queries(queries):
+        response = get(client, url, params)
+
+    assert response.status_code == 200
+
+
+def test_pruned_lists_select_fewer_columns(client, seed, django_assert_max_num_queries):
+    seed(SCALE)
+
+    with django_assert_max_num_queries(1) as captured:
+        get(client, '/inventory/', {'fields': 'id,name'})
+
+    sql = captured.captured_queries[0]['sql']
+    assert '"metadata"' not in sql
+    assert 'JOIN' not in sql
+
+
+@pytest.mark.parametrize('url', ['/inventory/', '/inventory/{id}/', '/orders/'])
+@pytest.mark.parametrize('params, param', [
+    ({'fields': 'id,nope'}, 'fields'),
+    ({'fields': 'type.nope'}, 'fields'),
+    ({'expand': 'nope'}, 'expand'),
+    ({'expand': 'name'}, 'expand'),
+])
+def test_unknown_fields_are_rejected(client, seed, url, params, param):
+    seed()
+    inventory = Inventory.objects.order_by('id').first()
+
+    response = get(client, url.format(id=inventory.id), params)
+
+    assert response.status_code == 400
+    assert set(response.json()) == {param}
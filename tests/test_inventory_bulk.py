@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+from django.db import connection, transaction
+
+from interview.inventory.models import Inventory, InventoryLanguage, InventoryType
+from interview.inventory.views import InventoryBulkCreateView
+from tests.conftest import make_item
+
+
+def test_bulk_rejects_oversized_batches(client, seed, monkeypatch):
+    seed()
+    monkeypatch.setattr(InventoryBulkCreateView, 'max_items', 2)
+
+    response = client.post('/inventory/bulk/', [make_item(f'Item {n}') for n in range(3)], content_type='application/json')
+
+    assert response.status_code == 400
+    assert not Inventory.objects.filter(name__startswith='Item ').exists()
+
+
+def test_bulk_upsert_updates_by_name(client, seed):
+    seed()
+    created = client.post('/inventory/bulk/?upsert=true', [make_item('Upserted')], content_type='application/json').json()
+    updated = client.post('/inventory/bulk/?upsert=true', [make_item('Upserted', 2001)], content_type='application/json').json()
+
+    assert updated['updated'] == created['created']
+    assert Inventory.objects.get(name='Upserted').metadata['year'] == 2001
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_upserts_of_a_new_name_insert_once(client, seed):
+    seed()
+    responses = []
+
+    def upsert():
+        try:
+            responses.append(client.post('/inventory/bulk/?upsert=true', [make_item('Raced')], content_type='application/json'))
+        finally:
+            connection.close()
+
+    # Hold the name's lock as another upsert would, then let the request
+    # run; it must wait and then see the row committed here.
+    with transaction.atomic():
+        InventoryBulkCreateView.lock_names({'Raced'})
+        thread = threading.Thread(target=upsert)
+        thread.start()
+        thread.join(timeout=0.5)
+        assert thread.is_alive()
+        Inventory.objects.create(
+            name='Raced',
+            type=InventoryType.get_by_name('Movie'),
+            language=InventoryLanguage.get_by_name('English'),
+            metadata=make_item('Raced')['metadata'],
+        )
+    thread.join()
+
+    assert responses[0].json()['updated']
+    assert Inventory.objects.filter(name='Raced').count() == 1
@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from interview.inventory.models import Inventory
+from interview.inventory.views import InventoryExportView
+
+
+@pytest.mark.parametrize('export_format', ['json', 'ndjson'])
+def test_export_pages_through_every_row(client, seed, monkeypatch, django_assert_max_num_queries, export_format):
+    seed(10)
+    monkeypatch.setattr(InventoryExportView, 'chunk_size', 3)
+    count = Inventory.objects.count()
+
+    # A query for the rows of each chunk plus one for its tags, and an empty
+    # one after the last chunk when it happens to be full.
+    with django_assert_max_num_queries(2 * -(-count // 3) + 1):
+        response = client.get(f'/inventory/export/?export_format={export_format}')
+        body = b''.join(response.streaming_content).decode('utf-8')
+
+    rows = json.loads(body) if export_format == 'json' else [json.loads(line) for line in body.splitlines()]
+    assert [row['id'] for row in rows] == list(Inventory.objects.order_by('id').values_list('id', flat=True))
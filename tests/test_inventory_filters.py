@@ -0,0 +1,69 @@
+import pytest
+
+from tests.conftest import make_item
+
+ITEMS = {
+    'Filtered A': {'year': 1999, 'imdb_rating': 6.9, 'rotten_tomatoes_rating': 50, 'actors': ['Keanu Reeves', 'Carrie-Anne Moss']},
+    'Filtered B': {'year': 2000, 'imdb_rating': 7.0, 'rotten_tomatoes_rating': 80, 'actors': ['Keanu Reeves']},
+    'Filtered C': {'year': 2010, 'imdb_rating': 8.45, 'rotten_tomatoes_rating': 95, 'actors': ['Tom Hardy']},
+}
+
+
+@pytest.fixture
+def filtered(client, seed):
+    seed()
+    items = []
+    for name, metadata in ITEMS.items():
+        item = make_item(name)
+        item['metadata'] = metadata
+        items.append(item)
+    client.post('/inventory/bulk/', items, content_type='application/json')
+
+
+def get_names(client, params: dict) -> set:
+    response = client.get('/inventory/', params, HTTP_ACCEPT='application/json')
+    assert response.status_code == 200
+
+    return {item['name'] for item in response.json()['results'] if item['name'] in ITEMS}
+
+
+@pytest.mark.parametrize('params, expected', [
+    ({'year_min': 2000}, {'Filtered B', 'Filtered C'}),
+    ({'year_max': 2000}, {'Filtered A', 'Filtered B'}),
+    ({'year_min': 2000, 'year_max': 2000}, {'Filtered B'}),
+    ({'year_min': 2011}, set()),
+])
+def test_year_bounds_are_inclusive(client, filtered, params, expected):
+    assert get_names(client, params) == expected
+
+
+@pytest.mark.parametrize('params, expected', [
+    ({'imdb_rating_min': 7}, {'Filtered B', 'Filtered C'}),
+    # 8.45 is stored rounded to one decimal.
+    ({'imdb_rating_min': 8.5}, {'Filtered C'}),
+    ({'imdb_rating_min': 8.6}, set()),
+    ({'rotten_tomatoes_rating_min': 80}, {'Filtered B', 'Filtered C'}),
+])
+def test_rating_minimums_are_inclusive(client, filtered, params, expected):
+    assert get_names(client, params) == expected
+
+
+@pytest.mark.parametrize('actors, expected', [
+    (['Keanu Reeves'], {'Filtered A', 'Filtered B'}),
+    (['Keanu Reeves', 'Carrie-Anne Moss'], {'Filtered A'}),
+    (['Keanu'], set()),
+])
+def test_actor_matches_every_given_actor_exactly(client, filtered, actors, expected):
+    assert get_names(client, {'actor': actors}) == expected
+
+
+def test_filters_combine(client, filtered):
+    assert get_names(client, {'actor': 'Keanu Reeves', 'year_min': 2000, 'imdb_rating_min': 7}) == {'Filtered B'}
+
+
+@pytest.mark.parametrize('params', [{'year_min': 'recent'}, {'imdb_rating_min': 11}, {'rotten_tomatoes_rating_min': -1}])
+def test_invalid_filters_are_rejected(client, filtered, params):
+    response = client.get('/inventory/', params, HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 400
+    assert set(response.json()) == set(params)
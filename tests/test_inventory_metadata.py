@@ -0,0 +1,77 @@
+import importlib
+from decimal import Decimal
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from interview.inventory.models import Inventory
+from tests.conftest import make_item
+
+backfill = importlib.import_module('interview.inventory.migrations.0005_backfill_inventory_metadata_columns')
+
+RATINGS = [
+    (7.45, Decimal('7.5')),
+    (-7.45, Decimal('-7.5')),
+    (99.94, Decimal('99.9')),
+    (99.95, None),
+    (-99.95, None),
+    (100, None),
+]
+
+
+@pytest.mark.parametrize('value, expected', RATINGS)
+def test_imdb_rating_is_rounded_or_null(client, seed, value, expected):
+    seed()
+    item = make_item('Rated')
+    item['metadata']['imdb_rating'] = value
+
+    response = client.post('/inventory/bulk/', [item], content_type='application/json')
+
+    assert response.status_code == 200
+    assert Inventory.objects.get(name='Rated').imdb_rating == expected
+
+
+@pytest.mark.parametrize('value, expected', RATINGS)
+def test_backfill_matches_sync_metadata_columns(client, seed, value, expected):
+    seed()
+    item = make_item('Rated')
+    item['metadata']['imdb_rating'] = value
+    client.post('/inventory/bulk/', [item], content_type='application/json')
+    Inventory.objects.update(year=None, imdb_rating=None, rotten_tomatoes_rating=None)
+
+    backfill.backfill_metadata_columns(apps, connection.schema_editor())
+
+    assert Inventory.objects.get(name='Rated').imdb_rating == expected
+
+
+def test_invalid_metadata_reports_errors_by_dotted_field(client, seed):
+    seed()
+    item = make_item('Invalid')
+    item['metadata'].update(year='unknown', actors=['Keanu Reeves', ['nested']])
+    del item['metadata']['imdb_rating']
+
+    response = client.post('/inventory/', item, content_type='application/json')
+
+    assert response.status_code == 400
+    assert set(response.json()['metadata']) == {'year', 'actors.1', 'imdb_rating'}
+    assert not Inventory.objects.filter(name='Invalid').exists()
+
+
+def test_bulk_validates_metadata_alongside_other_fields(client, seed):
+    seed()
+    valid = make_item('Valid')
+    invalid = make_item('Invalid')
+    invalid['name'] = ''
+    invalid['metadata']['year'] = 'unknown'
+    not_a_dict = make_item('Not a dict')
+    not_a_dict['metadata'] = ['year']
+
+    response = client.post('/inventory/bulk/', [valid, invalid, not_a_dict], content_type='application/json')
+
+    errors = response.json()['errors']
+    assert [error['index'] for error in errors] == [1, 2]
+    assert set(errors[0]['errors']) == {'name', 'metadata'}
+    assert set(errors[0]['errors']['metadata']) == {'year'}
+    assert set(errors[1]['errors']) == {'metadata'}
+    assert Inventory.objects.get(id__in=response.json()['created']).metadata == valid['metadata']
@@ -0,0 +1,29 @@
+import pytest
+
+from interview.inventory.models import Inventory
+from tests.conftest import SCALE
+
+
+@pytest.mark.parametrize('scale', [SCALE, 10 * SCALE])
+def test_inventory_list_query_count(client, seed, django_assert_num_queries, scale):
+    seed(scale)
+
+    # The page, then the tags of every item on it.
+    with django_assert_num_queries(2):
+        response = client.get('/inventory/', HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 200
+    assert len(response.json()['results']) == min(Inventory.objects.count(), 100)
+
+
+@pytest.mark.parametrize('scale', [SCALE, 10 * SCALE])
+def test_inventory_detail_query_count(client, seed, django_assert_num_queries, scale):
+    seed(scale)
+    inventory = Inventory.objects.order_by('-id').first()
+
+    # The item with its type and language, then its tags.
+    with django_assert_num_queries(2):
+        response = client.get(f'/inventory/{inventory.id}/', HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 200
+    assert response.json()['name'] == inventory.name
@@ -0,0 +1,91 @@
+import importlib
+import re
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from interview.inventory.models import Inventory
+from interview.inventory.search import SEARCH_ORDERING
+from interview.inventory.views import InventorySearchView
+from tests.conftest import SCALE
+
+backfill = importlib.import_module('interview.inventory.migrations.0008_backfill_inventory_search_vector')
+
+
+@pytest.mark.parametrize('q, match', [('matrix', 'prefix'), ('Matrx', 'fuzzy')])
+def test_search_finds_names(client, seed, q, match):
+    seed()
+
+    response = client.get('/inventory/search/', {'q': q, 'match': match}, HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 200
+    names = [row['name'] for row in response.json()['results']]
+    assert names[0] == 'The Matrix'
+    assert {'The Matrix Reloaded', 'The Matrix Revolutions'} <= set(names)
+
+
+def test_prefix_candidates_are_the_shortest_matching_names(seed):
+    seed(SCALE)
+    names = Inventory.objects.values_list('id', 'name')
+    expected = sorted(
+        (len(name), pk) for pk, name in names if re.search(r'(?i)\bthe', name)
+    )
+
+    assert len(expected) > 3
+    candidates = Inventory.objects.search('the', candidates=3).values_list('id', flat=True)
+    assert sorted(candidates) == sorted(pk for _, pk in expected[:3])
+
+
+def test_fuzzy_candidates_are_the_best_ranked(seed):
+    seed(SCALE)
+    ranked = Inventory.objects.search('Matrx', match='fuzzy').order_by(*SEARCH_ORDERING)
+
+    assert ranked.count() > 3
+    candidates = Inventory.objects.search('Matrx', match='fuzzy', candidates=3).order_by(*SEARCH_ORDERING)
+    assert list(candidates.values_list('id', flat=True)) == list(ranked.values_list('id', flat=True)[:3])
+
+
+@pytest.mark.parametrize('actors, words', [
+    (['Keanu Reeves', 'Carrie-Anne Moss'], {'keanu', 'reeves', 'carrie-anne', 'carrie', 'anne', 'moss'}),
+    (['Keanu Reeves', 1999, True], {'keanu', 'reeves', '1999', 'true'}),
+    ('Keanu Reeves', set()),
+    ({'lead': 'Keanu Reeves'}, set()),
+    (None, set()),
+])
+def test_backfill_matches_sync_metadata_columns(seed, actors, words):
+    seed()
+    inventory = Inventory.objects.order_by('id').first()
+    inventory.pk = None
+    inventory.name = 'Indexed'
+    inventory.metadata = {**inventory.metadata, 'actors': actors}
+    inventory.save()
+    saved = Inventory.objects.filter(pk=inventory.pk).values_list('search_vector', flat=True).get()
+    Inventory.objects.filter(pk=inventory.pk).update(search_vector=None)
+
+    backfill.backfill_search_vector(apps, connection.schema_editor())
+
+    assert Inventory.objects.filter(pk=inventory.pk).values_list('search_vector', flat=True).get() == saved
+    assert {lexeme.split(':')[0].strip("'") for lexeme in saved.split()} == {'indexed'} | words
+
+
+def test_late_exact_names_are_candidates(client, seed, monkeypatch):
+    seed()
+    monkeypatch.setattr(InventorySearchView, 'max_candidates', 3)
+    template = Inventory.objects.order_by('id').first()
+
+    def create(name: str, actors: list):
+        template.pk = None
+        template.name = name
+        template.metadata = {**template.metadata, 'actors': actors}
+        template.save()
+
+    create('Starring Zephyr', ['Zephyr Jones'])
+    for number in range(5):
+        create(f'Zephyr Part {number}', [])
+    create('Zephyr', [])
+
+    response = client.get('/inventory/search/', {'q': 'zephyr'}, HTTP_ACCEPT='application/json')
+
+    names = [row['name'] for row in response.json()['results']]
+    assert names == ['Zephyr', 'Zephyr Part 0', 'Zephyr Part 1']
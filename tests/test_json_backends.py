@@ -0,0 +1,79 @@
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from interview.core.encoding import JSON_BACKENDS, orjson
+from interview.core.parsers import FastJSONParser
+from interview.core.renderers import FastJSONRenderer
+
+# Values the API hands to the renderer outside serializer fields, characters
+# JSONRenderer escapes, and numbers orjson writes or reads differently.
+PAYLOADS = [
+    {'decimal': Decimal('7.5'), 'decimals': [Decimal('0'), Decimal('-12.25'), Decimal('9.9')]},
+    {
+        'date': date(2023, 3, 14),
+        'datetime': datetime(2023, 3, 14, 15, 9, 26, 535897, tzinfo=timezone.utc),
+        'naive_datetime': datetime(2023, 3, 14, 15, 9, 26),
+        'offset_datetime': datetime(2023, 3, 14, 15, 9, 26, 535000, tzinfo=timezone(timedelta(hours=-5))),
+    },
+    {'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678')},
+    {'text': 'Am\u00e9lie \u2014 \u2028line\u2029 "quoted" \\ \t 1e5'},
+    {'nested': {1: [True, False, None], 'float': 0.1}},
+    {'big': 2 ** 70, 'negative': -2 ** 64},
+    {'floats': [1e16, 1.5e300, 1e-05, -2.5e-7, 0.0001, 123456789.123, -0.0], 'next': None},
+    [None, 1e22, Decimal('1E+20')],
+]
+
+NON_FINITE = [float('nan'), float('inf'), float('-inf'), Decimal('NaN')]
+
+backends = pytest.mark.parametrize('backend', [
+    backend if backend != 'orjson' else pytest.param(
+        backend, marks=pytest.mark.skipif(orjson is None, reason='orjson is not installed'),
+    )
+    for backend in JSON_BACKENDS
+])
+
+
+@backends
+@pytest.mark.parametrize('data', PAYLOADS)
+def test_render_matches_json_renderer(settings, backend, data):
+    settings.JSON_BACKEND = backend
+
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@backends
+@pytest.mark.parametrize('value', NON_FINITE)
+def test_render_rejects_non_finite_numbers(settings, backend, value):
+    settings.JSON_BACKEND = backend
+
+    with pytest.raises(ValueError):
+        JSONRenderer().render({'next': None, 'value': value})
+    with pytest.raises(ValueError):
+        FastJSONRenderer().render({'next': None, 'value': value})
+
+
+@backends
+@pytest.mark.parametrize('data', PAYLOADS)
+def test_parse_matches_json_parser(settings, backend, data):
+    settings.JSON_BACKEND = backend
+    content = JSONRenderer().render(data)
+
+    assert FastJSONParser().parse(io.BytesIO(content)) == JSONParser().parse(io.BytesIO(content))
+
+
+@backends
+@pytest.mark.parametrize('content', [b'{"value": NaN}', b'[Infinity]', b'{"value": 1', b'[-Infinity]'])
+def test_parse_rejects_what_json_parser_rejects(settings, backend, content):
+    settings.JSON_BACKEND = backend
+
+    with pytest.raises(ParseError):
+        JSONParser().parse(io.BytesIO(content))
+    with pytest.raises(ParseError):
+        FastJSONParser().parse(io.BytesIO(content))
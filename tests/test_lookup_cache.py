@@ -0,0 +1,76 @@
+import pytest
+
+from interview.core.cache import get_model_version
+from interview.inventory.models import InventoryLanguage, InventoryTag, InventoryType
+from interview.order.models import OrderTag
+
+LOOKUP_LISTS = [
+    ('/inventory/types/', InventoryType),
+    ('/inventory/languages/', InventoryLanguage),
+    ('/inventory/tags/', InventoryTag),
+    ('/orders/tags/', OrderTag),
+]
+
+
+@pytest.mark.parametrize('url, model', LOOKUP_LISTS)
+def test_matching_etag_is_answered_with_304(client, seed, url, model):
+    seed()
+    response = client.get(url, HTTP_ACCEPT='application/json')
+
+    not_modified = client.get(url, HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=response['ETag'])
+    modified = client.get(url, HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH='"stale"')
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified['ETag'] == response['ETag']
+    assert not not_modified.content
+    assert modified.status_code == 200
+    assert modified.json() == response.json()
+
+
+@pytest.mark.parametrize('url, model', LOOKUP_LISTS)
+def test_cached_response_is_served_without_queries(client, seed, django_assert_num_queries, url, model):
+    seed()
+    response = client.get(url, HTTP_ACCEPT='application/json')
+
+    with django_assert_num_queries(0):
+        cached = client.get(url, HTTP_ACCEPT='application/json')
+
+    assert cached.json() == response.json()
+
+
+@pytest.mark.parametrize('url, model', [('/inventory/tags/', InventoryTag), ('/orders/tags/', OrderTag)])
+def test_tag_save_changes_the_version_on_commit(client, seed, django_capture_on_commit_callbacks, url, model):
+    seed()
+    response = client.get(url, HTTP_ACCEPT='application/json')
+    version = get_model_version(model)
+    tag = model.all_objects.order_by('id').first()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.name = 'Renamed'
+        tag.save()
+
+        assert get_model_version(model) == version
+
+    changed = client.get(url, HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=response['ETag'])
+
+    assert get_model_version(model) != version
+    assert changed.status_code == 200
+    assert changed['ETag'] != response['ETag']
+    assert 'Renamed' in {item['name'] for item in changed.json()}
+
+
+@pytest.mark.parametrize('url, model', [('/inventory/tags/', InventoryTag), ('/orders/tags/', OrderTag)])
+def test_tag_delete_changes_the_version_on_commit(client, seed, django_capture_on_commit_callbacks, url, model):
+    seed()
+    client.get(url, HTTP_ACCEPT='application/json')
+    version = get_model_version(model)
+    tag = model.objects.create(name='Deleted')
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.delete()
+
+        assert get_model_version(model) == version
+
+    assert get_model_version(model) != version
+    assert 'Deleted' not in {item['name'] for item in client.get(url, HTTP_ACCEPT='application/json').json()}
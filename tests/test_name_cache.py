@@ -0,0 +1,129 @@
+import time
+
+import pytest
+
+from interview.core import behaviors, cache
+from interview.core.behaviors import get_name_cache
+from interview.core.cache import bump_model_version, get_model_version
+from interview.inventory.models import InventoryTag, InventoryType
+from interview.order.models import OrderTag
+
+
+@pytest.fixture
+def tag_cache(seed, settings, monkeypatch):
+    """
+    A new, empty name cache for `InventoryTag` holding at most two names, and
+    three seeded tag names to fill it with.
+    """
+    seed()
+    settings.NAME_CACHE_MAXSIZE = 2
+    monkeypatch.delitem(behaviors._name_caches, InventoryTag, raising=False)
+
+    return list(InventoryTag.objects.order_by('id').values_list('name', flat=True)[:3])
+
+
+def test_the_cache_evicts_the_least_recently_used_name(tag_cache, django_assert_num_queries):
+    first, second, third = tag_cache
+    InventoryTag.get_by_name(first)
+    InventoryTag.get_by_name(second)
+    InventoryTag.get_by_name(first)
+    InventoryTag.get_by_name(third)
+
+    assert InventoryTag.name_cache_info()['size'] == 2
+    with django_assert_num_queries(0):
+        assert InventoryTag.get_by_name(first).name == first
+        assert InventoryTag.get_by_name(third).name == third
+    with django_assert_num_queries(1):
+        assert InventoryTag.get_by_name(second).name == second
+
+
+def test_the_cache_counts_hits_and_misses(tag_cache):
+    first, second, _ = tag_cache
+    InventoryTag.get_by_name(first)
+    InventoryTag.get_by_name(first)
+    InventoryTag.get_by_name(second)
+    InventoryTag.get_by_name('Missing')
+
+    assert InventoryTag.name_cache_info() == {'hits': 1, 'misses': 3, 'size': 2, 'maxsize': 2}
+
+
+def test_many_names_are_resolved_with_one_query(seed, django_assert_num_queries):
+    seed()
+    names = list(InventoryTag.objects.order_by('id').values_list('name', flat=True)[:4])
+    InventoryTag.get_by_name(names[0])
+    InventoryTag.get_by_name(names[1])
+    before = InventoryTag.name_cache_info()
+
+    with django_assert_num_queries(1):
+        found = InventoryTag.get_many_by_name([*names, names[0], 'Missing'])
+
+    assert {name: tag.name for name, tag in found.items()} == {name: name for name in names}
+    after = InventoryTag.name_cache_info()
+    assert (after['hits'] - before['hits'], after['misses'] - before['misses']) == (2, 3)
+
+    with django_assert_num_queries(0):
+        assert set(InventoryTag.get_many_by_name(names)) == set(names)
+
+
+def test_name_cache_follows_the_shared_version(seed, settings):
+    seed()
+    settings.NAME_CACHE_VERSION_TTL = 0.05
+    movie = InventoryType.get_by_name('Movie')
+    # A write made by another process: no signal reaches this one, only the
+    # version it moves forward on commit.
+    InventoryType.objects.filter(pk=movie.pk).update(name='Film')
+
+    assert InventoryType.get_by_name('Movie').pk == movie.pk
+
+    bump_model_version(InventoryType)
+
+    assert InventoryType.get_by_name('Movie').pk == movie.pk
+
+    time.sleep(0.05)
+
+    assert InventoryType.get_by_name('Movie') is None
+    assert InventoryType.get_by_name('Film').pk == movie.pk
+
+
+def test_the_shared_version_is_read_once_per_ttl(seed, settings, monkeypatch):
+    seed()
+    settings.NAME_CACHE_VERSION_TTL = 60
+    reads = []
+    monkeypatch.setattr(behaviors, 'get_model_version', lambda model: reads.append(model) or get_model_version(model))
+
+    for _ in range(3):
+        InventoryType.get_by_name('Movie')
+        InventoryType.get_many_by_name(['Movie', 'Missing'])
+
+    assert reads == [InventoryType]
+
+
+def test_saves_move_the_version_forward_on_commit(seed, settings, django_capture_on_commit_callbacks):
+    seed()
+    settings.NAME_CACHE_VERSION_TTL = 60
+    movie = InventoryType.get_by_name('Movie')
+    version = get_model_version(InventoryType)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        movie.name = 'Film'
+        movie.save()
+
+        assert InventoryType.get_by_name('Movie') is None
+        assert get_model_version(InventoryType) == version
+
+    assert get_model_version(InventoryType) != version
+    assert InventoryType.get_by_name('Film').pk == movie.pk
+    assert get_name_cache(InventoryType).version == get_model_version(InventoryType)
+
+
+@pytest.mark.parametrize('model', [InventoryType, InventoryTag, OrderTag])
+def test_a_lookup_save_moves_the_version_once(seed, django_capture_on_commit_callbacks, monkeypatch, model):
+    seed()
+    bumped = []
+    monkeypatch.setattr(cache, 'bump_model_version', bumped.append)
+    instance = model._default_manager.order_by('id').first()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        instance.save()
+
+    assert bumped == [model]
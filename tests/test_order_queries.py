@@ -0,0 +1,17 @@
+import pytest
+
+from interview.order.models import Order
+from tests.conftest import SCALE
+
+
+@pytest.mark.parametrize('scale', [SCALE, 10 * SCALE])
+def test_order_list_query_count(client, seed, django_assert_num_queries, scale):
+    seed(scale)
+
+    # The page with each order's inventory, its type and language, then the
+    # order tags and the inventory tags of the whole page.
+    with django_assert_num_queries(3):
+        response = client.get('/orders/', HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 200
+    assert len(response.json()['results']) == min(Order.objects.count(), 100)
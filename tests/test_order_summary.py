@@ -0,0 +1,133 @@
+import datetime
+import threading
+
+import pytest
+from django.db import connection, transaction
+from django.db.models import Max, Min
+
+from interview.order.models import Order, OrderTag
+from interview.order.summary import get_order_summary, rebuild_order_summary
+from tests.conftest import SCALE, get_rows
+
+
+def get_range() -> tuple:
+    bounds = Order.all_objects.aggregate(first=Min('start_date'), last=Max('embargo_date'))
+    middle = bounds['first'] + (bounds['last'] - bounds['first']) / 2
+
+    return middle, middle + datetime.timedelta(days=30)
+
+
+@pytest.fixture
+def changed_orders(seed):
+    """
+    Seeded orders changed through every path the summary receivers follow.
+    """
+    seed(SCALE)
+    tag, other = OrderTag.all_objects.order_by('id')[:2]
+    orders = list(Order.all_objects.order_by('id')[:5])
+
+    created = Order.objects.create(
+        inventory=orders[0].inventory,
+        start_date=datetime.date(2000, 1, 1),
+        embargo_date=datetime.date(2000, 6, 1),
+    )
+    created.tags.add(tag, other)
+    inverted = Order.objects.create(
+        inventory=orders[0].inventory,
+        start_date=datetime.date(2000, 3, 1),
+        embargo_date=datetime.date(2000, 2, 1),
+    )
+    inverted.tags.add(tag)
+    orders[1].start_date -= datetime.timedelta(days=400)
+    orders[1].save()
+    orders[2].tags.clear()
+    tag.orders.add(orders[3])
+    Order.deactivate(orders[4].pk)
+    orders[0].delete()
+
+
+@pytest.mark.parametrize('is_active', [None, True, False])
+def test_summary_receivers_match_a_rebuild(changed_orders, is_active):
+    date_from, date_to = get_range()
+    rows = get_rows()
+    summary = get_order_summary(date_from, date_to, is_active=is_active)
+
+    rebuild_order_summary()
+
+    assert get_rows() == rows
+    assert get_order_summary(date_from, date_to, is_active=is_active) == summary
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_saves_of_an_order_match_a_rebuild(seed):
+    seed(SCALE)
+    order = Order.all_objects.filter(tags__isnull=False).order_by('id').first()
+
+    def save_other():
+        try:
+            other = Order.all_objects.get(pk=order.pk)
+            other.start_date -= datetime.timedelta(days=200)
+            other.save()
+        finally:
+            connection.close()
+
+    # Save the order and keep its transaction open while another save of
+    # the same order starts; it must wait, then move the counts from the
+    # dates saved here rather than from the ones both read first.
+    with transaction.atomic():
+        order.start_date -= datetime.timedelta(days=100)
+        order.save()
+        thread = threading.Thread(target=save_other)
+        thread.start()
+        thread.join(timeout=0.5)
+        assert thread.is_alive()
+    thread.join()
+
+    rows = get_rows()
+    rebuild_order_summary()
+
+    assert get_rows() == rows
+
+
+@pytest.mark.parametrize('date_from, date_to', [
+    (datetime.date(2000, 1, 15), datetime.date(2000, 7, 1)),
+    (datetime.date(2000, 2, 15), datetime.date(2000, 3, 15)),
+])
+def test_open_matches_the_orders_in_effect(changed_orders, date_from, date_to):
+    tag = OrderTag.all_objects.order_by('id').first()
+    # Inverted windows, never in effect: before and across the range.
+    for start_date, embargo_date in ((datetime.date(2000, 1, 10), datetime.date(1999, 12, 1)), (date_to, date_from)):
+        Order.objects.create(
+            inventory=Order.all_objects.order_by('id').first().inventory,
+            start_date=start_date,
+            embargo_date=embargo_date,
+        ).tags.add(tag)
+
+    def in_effect(tag_name: str, day: datetime.date) -> int:
+        return Order.all_objects.in_effect_on(day).filter(tags__name=tag_name).count()
+
+    summary = get_order_summary(date_from, date_to)
+
+    assert tag.name in {row['tag'] for row in summary}
+    for row in summary:
+        assert row['open'] == in_effect(row['tag'], date_from - datetime.timedelta(days=1))
+        for day in row['days']:
+            assert day['open'] == in_effect(row['tag'], datetime.date.fromisoformat(day['date']))
+
+
+def test_seeded_inverted_orders_are_never_open(seed):
+    seed()
+    today = datetime.date.today()
+    date_from, date_to = today - datetime.timedelta(days=40), today + datetime.timedelta(days=40)
+
+    for row in get_order_summary(date_from, date_to):
+        assert row['open'] >= 0
+        assert all(day['open'] >= 0 for day in row['days'])
+
+
+def test_summary_reads_two_queries(seed, django_assert_num_queries):
+    seed(SCALE)
+    date_from, date_to = get_range()
+
+    with django_assert_num_queries(2):
+        get_order_summary(date_from, date_to, tags=['Austin'])
@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+
+from interview.inventory.models import Inventory
+from interview.order.models import Order, OrderTag
+
+WINDOWS = {
+    'first': (datetime.date(1990, 1, 10), datetime.date(1990, 1, 20)),
+    'second': (datetime.date(1990, 1, 20), datetime.date(1990, 2, 1)),
+    # Embargoed before it starts, so never in effect.
+    'inverted': (datetime.date(1990, 1, 15), datetime.date(1990, 1, 5)),
+    'inactive': (datetime.date(1990, 1, 1), datetime.date(1990, 3, 1)),
+}
+
+
+@pytest.fixture
+def windows(seed) -> dict:
+    seed()
+    inventory = Inventory.objects.order_by('id').first()
+    orders = {
+        name: Order.objects.create(inventory=inventory, start_date=start_date, embargo_date=embargo_date)
+        for name, (start_date, embargo_date) in WINDOWS.items()
+    }
+    Order.deactivate(orders['inactive'].pk)
+    orders['first'].tags.add(OrderTag.objects.create(name='Window'))
+
+    return {order.id: name for name, order in orders.items()}
+
+
+def get_names(client, windows: dict, params: dict) -> set:
+    response = client.get('/orders/window/', params, HTTP_ACCEPT='application/json')
+    assert response.status_code == 200
+
+    return {windows[order['id']] for order in response.json()['results'] if order['id'] in windows}
+
+
+@pytest.mark.parametrize('day, expected', [
+    ('1990-01-10', {'first'}),
+    ('1990-01-19', {'first'}),
+    # The embargo date itself is outside the window.
+    ('1990-01-20', {'second'}),
+    ('1990-02-01', set()),
+])
+def test_orders_in_effect_on_a_date(client, windows, day, expected):
+    assert get_names(client, windows, {'date': day}) == expected
+
+
+@pytest.mark.parametrize('date_from, date_to, match, expected', [
+    ('1990-01-19', '1990-01-20', 'overlap', {'first', 'second'}),
+    ('1990-01-19', '1990-01-20', 'contains', set()),
+    ('1990-01-21', '1990-01-25', 'contains', {'second'}),
+    ('1990-01-01', '1990-01-09', 'overlap', set()),
+    ('1990-01-01', '1990-01-10', 'overlap', {'first'}),
+])
+def test_orders_in_a_date_range(client, windows, date_from, date_to, match, expected):
+    params = {'date_from': date_from, 'date_to': date_to, 'match': match}
+
+    assert get_names(client, windows, params) == expected
+
+
+def test_inactive_orders_are_listed_on_request(client, windows):
+    params = {'date_from': '1990-01-01', 'date_to': '1990-01-09'}
+
+    assert get_names(client, windows, {**params, 'is_active': 'false'}) == {'inactive'}
+    assert get_names(client, windows, {**params, 'include_inactive': 'true'}) == {'inactive'}
+
+
+def test_orders_are_filtered_by_tag(client, windows):
+    params = {'date_from': '1990-01-01', 'date_to': '1990-02-01', 'tag': 'Window'}
+
+    assert get_names(client, windows, params) == {'first'}
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'date_from': '1990-01-01'},
+    {'date_to': '1990-01-01'},
+    {'date': '1990-01-01', 'date_from': '1990-01-01', 'date_to': '1990-01-02'},
+    {'date_from': '1990-01-02', 'date_to': '1990-01-01'},
+    {'date': 'soon'},
+])
+def test_invalid_dates_are_rejected(client, windows, params):
+    response = client.get('/orders/window/', params, HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 400
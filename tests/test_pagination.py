@@ -0,0 +1,23 @@
+import json
+from base64 import urlsafe_b64encode
+
+import pytest
+
+
+def encode(payload) -> str:
+    return urlsafe_b64encode(json.dumps(payload).encode('ascii')).decode('ascii')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('path', ['/inventory/', '/inventory/async/', '/orders/', '/orders/async/'])
+@pytest.mark.parametrize('cursor', [
+    'garbage!!',
+    encode(['not a date', 1]),
+    encode(['2024-01-01T00:00:00+00:00', 'x']),
+    'WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwgMWU0MDBd',  # ["2024-01-01T00:00:00+00:00", 1e400]
+])
+def test_invalid_cursor_is_not_found(client, path, cursor):
+    response = client.get(path, {'cursor': cursor}, HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 404
+    assert response.json() == {'detail': 'Invalid cursor'}
@@ -0,0 +1,61 @@
+import re
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from interview.core.profiling import ProfilingMiddleware, registry
+from interview.inventory.models import Inventory
+
+
+@pytest.fixture
+def profiled(settings):
+    settings.PROFILING_SAMPLE_RATE = 1
+    settings.PROFILING_SERVER_TIMING = True
+    registry.clear()
+    yield
+    registry.clear()
+
+
+def get_queries(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response['Server-Timing']).group(1))
+
+
+def test_sync_requests_are_profiled(client, seed, profiled):
+    seed()
+
+    response = client.get('/inventory/', HTTP_ACCEPT='application/json')
+
+    assert get_queries(response) == 2
+    assert registry.total('request_queries') == (2, 1)
+
+
+def test_async_requests_are_profiled(async_client, seed, profiled):
+    seed()
+
+    response = async_to_sync(async_client.get)('/inventory/async/', HTTP_ACCEPT='application/json')
+
+    assert get_queries(response) == 2
+    assert registry.total('request_queries') == (2, 1)
+
+
+@pytest.mark.parametrize('url', ['/inventory/{id}/', '/inventory/async/{id}/', '/inventory/tags/', '/orders/tags/'])
+def test_drf_serialization_is_profiled(client, async_client, seed, profiled, url):
+    seed()
+    inventory = Inventory.objects.order_by('id').first()
+    url = url.format(id=inventory.id)
+
+    if '/async/' in url:
+        response = async_to_sync(async_client.get)(url, HTTP_ACCEPT='application/json')
+    else:
+        response = client.get(url, HTTP_ACCEPT='application/json')
+
+    assert response.status_code == 200
+    assert registry.total('request_serialize_seconds')[0] > 0
+
+
+def test_middleware_follows_the_mode_of_the_handler():
+    async def get_response(request):
+        pass
+
+    assert iscoroutinefunction(ProfilingMiddleware(get_response))
+    assert not iscoroutinefunction(ProfilingMiddleware(lambda request: None))
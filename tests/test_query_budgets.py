@@ -0,0 +1,30 @@
+import pytest
+
+from interview.core.querycount import count_queries, get_path, get_query_string, get_routes, load_budgets
+from tests.conftest import SCALE
+
+BUDGETS = load_budgets()
+ROUTES = [(route, view_class) for route, view_class in get_routes() if view_class is None or hasattr(view_class, 'get')]
+
+
+@pytest.mark.parametrize('route, view_class', ROUTES, ids=[route for route, _ in ROUTES])
+def test_query_count_is_within_budget(client, seed, route, view_class):
+    entry = BUDGETS.get(route, {})
+    if 'skip' in entry:
+        pytest.skip(entry['skip'])
+    assert 'budget' in entry, f'{route}: no budget in query_budgets.json'
+
+    counts = []
+    for scale, seed_number in ((SCALE, 0), (9 * SCALE, 1)):
+        seed(scale, seed=seed_number)
+        status, queries = count_queries(client, get_path(route, view_class, entry), get_query_string(entry))
+        assert status == 200, f'{route}: GET returned {status}; add a query string or a skip to query_budgets.json'
+        counts.append(queries)
+
+    small, large = counts
+    assert large <= small, f'{route}: {small} queries at N rows, {large} at 10N'
+    assert large <= entry['budget'], f'{route}: {large} queries, budget {entry["budget"]}'
+
+
+def test_every_budget_is_routed():
+    assert set(BUDGETS) <= {route for route, _ in ROUTES}
@@ -0,0 +1,85 @@
+import pytest
+
+from interview.inventory.models import InventoryTag
+from interview.order.models import Order, OrderDailySummary, OrderTag
+from interview.order.summary import rebuild_order_summary
+from tests.conftest import SCALE, get_rows
+
+SET_ACTIVE_URLS = ['/inventory/tags/active/', '/orders/tags/active/', '/orders/active/']
+
+
+def post(client, url: str, data: dict):
+    return client.post(url, data, content_type='application/json')
+
+
+@pytest.mark.parametrize('model', [InventoryTag, OrderTag, Order])
+def test_activate_and_deactivate_set_the_named_state(seed, model):
+    seed()
+    row = model.all_objects.filter(is_active=True).order_by('id').first()
+
+    assert model.deactivate(row.pk) == 1
+    assert model.all_objects.get(pk=row.pk).is_active is False
+
+    assert model.activate(row.pk) == 1
+    assert model.all_objects.get(pk=row.pk).is_active is True
+
+
+@pytest.mark.parametrize('url, model', [('/inventory/tags/active/', InventoryTag), ('/orders/tags/active/', OrderTag)])
+def test_tags_are_set_by_name_and_only_changed_rows_count(client, seed, url, model):
+    seed()
+    names = list(model.all_objects.order_by('id').values_list('name', flat=True)[:2])
+
+    response = post(client, url, {'is_active': False, 'name': names})
+
+    assert response.status_code == 200
+    assert response.json() == {'updated': 2}
+    assert set(model.all_objects.filter(is_active=False).values_list('name', flat=True)) == set(names)
+    assert post(client, url, {'is_active': False, 'name': names}).json() == {'updated': 0}
+    assert post(client, url, {'is_active': True, 'name': names[:1]}).json() == {'updated': 1}
+
+
+def test_orders_are_set_by_ids(client, seed):
+    seed()
+    ids = list(Order.all_objects.filter(is_active=True).order_by('id').values_list('id', flat=True)[:3])
+
+    response = post(client, '/orders/active/', {'is_active': False, 'ids': ids})
+
+    assert response.json() == {'updated': 3}
+    assert not Order.all_objects.filter(id__in=ids, is_active=True).exists()
+
+
+@pytest.mark.parametrize('url', SET_ACTIVE_URLS)
+@pytest.mark.parametrize('data', [{'is_active': False}, {'is_active': False, 'ids': []}])
+def test_a_request_without_a_selector_is_rejected(client, seed, url, data):
+    seed()
+
+    response = post(client, url, data)
+
+    assert response.status_code == 400
+    assert not OrderTag.all_objects.filter(is_active=False).exists()
+    assert not InventoryTag.all_objects.filter(is_active=False).exists()
+
+
+def test_orders_need_both_window_dates(client, seed):
+    seed()
+
+    response = post(client, '/orders/active/', {'is_active': False, 'date_from': '2023-01-01'})
+
+    assert response.status_code == 400
+
+
+def test_setting_orders_moves_their_summary_counts(client, seed):
+    seed(SCALE)
+    tag = OrderTag.all_objects.order_by('id').first()
+    tagged = Order.all_objects.filter(tags=tag, is_active=True).count()
+    inactive = OrderDailySummary.objects.filter(tag=tag, is_active=False)
+    starts = sum(inactive.values_list('starts', flat=True))
+    assert tagged
+
+    response = post(client, '/orders/active/', {'is_active': False, 'tag': [tag.name]})
+
+    assert response.json() == {'updated': tagged}
+    assert sum(inactive.values_list('starts', flat=True)) == starts + tagged
+    rows = get_rows()
+    rebuild_order_summary()
+    assert get_rows() == rows